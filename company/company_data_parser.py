@@ -1,3 +1,4 @@
+import asyncio
 import csv
 import io
 import json
@@ -11,12 +12,18 @@ from pathlib import Path
 from typing import Any
 from urllib.parse import urljoin, urlparse
 
+import ahocorasick
+import ijson
+import orjson
 import pandas as pd
 import yfinance as yf
-from bs4 import BeautifulSoup
+from aiolimiter import AsyncLimiter
 from curl_cffi import requests
+from curl_cffi.const import CurlHttpVersion
+from curl_cffi.requests import AsyncSession
 from curl_cffi.requests.errors import RequestsError
 from rapidfuzz import fuzz
+from selectolax.lexbor import LexborHTMLParser
 from yfinance.exceptions import YFException, YFRateLimitError
 
 # --- Setup Logging ---
@@ -31,6 +38,7 @@ logger = logging.getLogger(__name__)
 # --- Configuration & Constants ---
 BASE_DIR = Path(__file__).resolve().parent
 DATA_FILE = BASE_DIR / "company_data.json"
+DATA_TMP_FILE = BASE_DIR / "company_data.json.tmp"
 HISTORY_FILE = BASE_DIR / "company_history.csv"
 CHARTS_DATA_FILE = BASE_DIR / "charts_data.json"
 TEMP_FILE = BASE_DIR / "comp.json"
@@ -38,6 +46,11 @@ JOBS_DATA = BASE_DIR / "../jobs/jobs.json"
 KEYWORDS_FILE = BASE_DIR / "keywords.txt"
 RETENTION_DAYS = 400
 MIN_GROWTH_THRESHOLD = 25  # Don't calculate trends for very small teams
+MAX_CONCURRENCY = 15  # Parallel company page fetches
+SEARCH_CONCURRENCY = 4  # Parallel result pages per search keyword
+LINKEDIN_MAX_RATE = 60  # Max LinkedIn requests per minute
+SAVE_EVERY = 50  # Checkpoint to disk after these many fetches
+RECENT_REFRESH = timedelta(hours=12)  # Skip large companies refreshed this recently
 avoid_words = [
     "confidential",
     "confidencial",
@@ -47,12 +60,31 @@ avoid_words = [
     "study from",
     "anonymous",
 ]
+# Aho-Corasick automaton matching every avoid word in one pass
+AVOID_MATCHER = ahocorasick.Automaton()
+for word in avoid_words:
+    AVOID_MATCHER.add_word(word, word)
+AVOID_MATCHER.make_automaton()
 guest_job_url = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+# Precompiled patterns for employee counts and LinkedIn urls
+EMP_RE = re.compile(r"(?P<lo>\d+)(?:\s*[\-\–\—]\s*(?P<hi>\d+)|(?P<plus>\+))?")
+COUNT_BOUND_RE = re.compile(r"(\d+)\+?$")  # Upper bound of an emp_count value
+LINKEDIN_HOST_RE = re.compile(r"https?://[a-z]{1,4}\.linkedin\.com")
+# Company link inside each job card of the search results
+CARD_LINK_CSS = "div.base-card h4.base-search-card__subtitle a[href]"
+# CSS selectors for company pages, queried with css_first
+WEBSITE_CSS = 'a[href][aria-describedby*="websitelink" i]'
+SIZE_CSS = 'div[data-test-id="about-us__size"] dd'
+LN_COUNT_CSS = 'span[data-test-id="view-all-employees-cta"] p'
+ORG_TYPE_CSS = 'div[data-test-id="about-us__organizationType"] dd'
 # Official CSV URLs
 NSE_URL = "https://archives.nseindia.com/content/equities/EQUITY_L.csv"
 BSE_URL = "https://www.bseindia.com/downloads1/List_of_companies.csv"
 
+# Shared session keeps connections and TLS sessions alive across requests
+SESSION = requests.Session(impersonate="chrome", headers={"User-Agent": USER_AGENT})
+
 now = datetime.now(timezone.utc)
 day_of_week = now.weekday()  # 0 = Monday, 6 = Sunday
 # Discovery: Only crawl for NEW companies on Mon, Wed (0,2)
@@ -119,9 +151,7 @@ class LnSearch:
     def normalize_url(url: str) -> str:
         if not url:
             return ""
-        return re.sub(
-            r"https?://[a-z]{1,4}\.linkedin\.com", "https://www.linkedin.com", url
-        )
+        return LINKEDIN_HOST_RE.sub("https://www.linkedin.com", url)
 
     @staticmethod
     def get_handle(url: str) -> str | None:
@@ -135,68 +165,97 @@ class LnSearch:
             return None
 
     @staticmethod
-    def get_companies(keyword: str, seen: set) -> tuple[list, set]:
+    async def get_companies(
+        session: AsyncSession, limiter: AsyncLimiter, keyword: str, seen: set
+    ) -> tuple[list, set]:
         max_range = 100 if keyword else 500
         comp_list = []
         # Exponential Decay - index 0 a weight of 10, and index 1 onwards a weight of 1
         weights = [10 if i == 0 else 1 for i in range(len(GEO_IDs))]
         geo = random.choices(GEO_IDs, weights=weights, k=1)[0]
         logger.info(f"Searching in: {geo}")
-        for start in range(0, max_range, 25):
+        # Fan out all result pages over the shared HTTP/2 connection
+        sem = asyncio.Semaphore(SEARCH_CONCURRENCY)
+        exhausted = asyncio.Event()
+        starts = range(0, max_range, 25)
+        pages = await asyncio.gather(
+            *(
+                LnSearch._get_cards(session, limiter, sem, exhausted, keyword, st, geo)
+                for st in starts
+            )
+        )
+
+        # Deduplicate in page order so results don't depend on response timing
+        for start, cards in zip(starts, pages):
+            for name, href in cards:
+                link = LnSearch.normalize_url(href)
+                if not link:
+                    continue
+                if "linkedin.com" not in link:
+                    continue
+                handle = LnSearch.get_handle(link)
+                # If handle is already in seen, we skip it entirely.
+                if not handle or handle in seen:
+                    continue
+                comp_list.append({"name": name, "linkedin": link})
+                seen.add(handle)
+
+            logger.info(f"Keyword '{keyword}' at {start}: List is now {len(comp_list)}")
+        return comp_list, seen
+
+    @staticmethod
+    async def _get_cards(
+        session: AsyncSession,
+        limiter: AsyncLimiter,
+        sem: asyncio.Semaphore,
+        exhausted: asyncio.Event,
+        keyword: str,
+        start: int,
+        geo: dict,
+    ) -> list[tuple[str, str]]:
+        """Fetch one search result page and return (name, href) for each job card."""
+        async with sem:
+            # An earlier page ran out of results, later offsets will be empty too
+            if exhausted.is_set():
+                return []
             try:
                 params = LnSearch.get_search_params(keyword, start, geo)
-                resp = requests.get(
-                    guest_job_url,
-                    params=params,
-                    headers={"User-Agent": USER_AGENT},
-                    timeout=15,
-                    impersonate="chrome",
-                )
+                async with limiter:
+                    resp = await session.get(guest_job_url, params=params, timeout=15)
 
                 if resp.status_code != 200:
                     logger.error(
                         f"Search failed for {keyword} at {start}: {resp.status_code}"
                     )
-                    break
+                    # Stop the keyword here, like the old page loop did
+                    exhausted.set()
+                    return []
 
-                soup = BeautifulSoup(resp.text, "html.parser")
-                job_cards = soup.find_all("div", class_="base-card")
+                # Pages past the last result come back without job cards, skip parsing
+                if len(resp.content) < 512 or b"base-card" not in resp.content:
+                    exhausted.set()
+                    return []
 
-                for card in job_cards:
-                    title_tag = card.find("h4", class_="base-search-card__subtitle")
-                    if not title_tag:
-                        continue
+                tree = LexborHTMLParser(resp.content)
 
-                    name = title_tag.get_text(strip=True)
-                    link_tag = title_tag.find("a", href=True)
-
-                    if name and link_tag:
-                        link = LnSearch.normalize_url(link_tag["href"])
-                        if not link:
-                            continue
-                        if "linkedin.com" not in link:
-                            continue
-                        handle = LnSearch.get_handle(link)
-                        # If handle is already in seen, we skip it entirely.
-                        if not handle or handle in seen:
-                            continue
-                        comp_list.append({"name": name, "linkedin": link})
-                        seen.add(handle)
-
-                logger.info(
-                    f"Keyword '{keyword}' at {start}: List is now {len(comp_list)}"
-                )
-                time.sleep(random.uniform(0.5, 2.0))
+                cards = []
+                # One selector pass yields every company link across all job cards
+                for link_tag in tree.css(CARD_LINK_CSS):
+                    name = link_tag.parent.text(strip=True)
+                    if name:
+                        cards.append((name, link_tag.attributes["href"]))
+                return cards
 
             except (
+                RequestsError,
                 ValueError,
                 KeyError,
                 AttributeError,
                 TypeError,
             ) as e:
                 logger.error(f"Exception during search crawl: {e}")
-                time.sleep(random.uniform(1.0, 3.0))
-        return comp_list, seen
+                await asyncio.sleep(random.uniform(1.0, 3.0))
+        return []
 
 
 class FinancialService:
@@ -711,35 +770,41 @@ class CompanyParser:
         if not text:
             return None
         text = text.replace(",", "").strip()
+        m = EMP_RE.search(text)
+        if not m:
+            return None
         # Range Match (e.g. 100-500)
-        m = re.search(r"(\d+)\s*[\-\–\—]\s*(\d+)", text)
-        if m:
-            return f"{m.group(1)}-{m.group(2)}"
+        if m["hi"]:
+            return f"{m['lo']}-{m['hi']}"
         # Plus Match (e.g. 500+)
-        m = re.search(r"(\d+)\+", text)
-        if m:
-            return f"{m.group(1)}+"
+        if m["plus"]:
+            return f"{m['lo']}+"
         # Digits only
-        m = re.search(r"(\d+)", text)
-        return m.group(1) if m else None
+        return m["lo"]
+
+    @staticmethod
+    def has_avoid_word(name: str) -> bool:
+        """Checks all avoid_words in a single pass over the lowercased name."""
+        return next(AVOID_MATCHER.iter(name.lower()), None) is not None
 
     @staticmethod
-    def get_company_details(i: int, company: dict[str, Any]) -> dict[str, Any] | None:
+    async def get_company_details(
+        session: AsyncSession,
+        limiter: AsyncLimiter,
+        i: int,
+        company: dict[str, Any],
+    ) -> dict[str, Any] | None:
         name, url = company.get("name"), company.get("linkedin")
         # avoid blank names and unwanted company names
-        if not name or any(word in name.lower() for word in avoid_words):
+        if not name or CompanyParser.has_avoid_word(name):
             return None
         # avoid blank urls and school page urls
         if not url or "linkedin.com/school" in url:
             return None
 
         try:
-            resp = requests.get(
-                url,
-                headers={"User-Agent": USER_AGENT},
-                timeout=15,
-                impersonate="chrome",
-            )
+            async with limiter:
+                resp = await session.get(url, timeout=15)
             status = resp.status_code
             logger.info(f"Detail Fetch #{i} | {status=} | {name}")
             if status == 404:
@@ -747,101 +812,104 @@ class CompanyParser:
                     f"Company page not found (404): {name}. Marking as inactive!"
                 )
                 company["active"] = False
-                time.sleep(random.uniform(1.0, 3.0))
                 return company
 
             if status != 200:
                 logger.error(f"Failed to load: {url}")
-                time.sleep(random.uniform(1.0, 3.0))
+                await asyncio.sleep(random.uniform(1.0, 3.0))
                 return company
 
-            # Parse the html response
-            soup = BeautifulSoup(resp.text, "html.parser")
-
-            # Website Parsing
-            website = CompanyParser._extract_website(soup)
-            if website and "http" in website:
-                company["website"] = website
-
-            # Headcount Parsing
-            if emp_count := CompanyParser._extract_headcount(soup):
-                company["emp_count"] = emp_count
-
-            # Linkedin Employee Count
-            if ln_count := CompanyParser._extract_ln_headcount(soup):
-                company["ln_count"] = ln_count
+            page = CompanyParser.parse_company_page(resp.content)
+            if page["website"] and "http" in page["website"]:
+                company["website"] = page["website"]
+            if page["emp_count"]:
+                company["emp_count"] = page["emp_count"]
+            if page["ln_count"]:
+                company["ln_count"] = page["ln_count"]
 
             # Organization Type (Public/Private)
-            is_public, ticker = CompanyParser._extract_org_type(
-                soup, name, company.get("ticker")
+            # Ticker lookups are blocking calls, keep them off the event loop
+            is_public, ticker = await asyncio.to_thread(
+                CompanyParser._resolve_ticker,
+                page["public"],
+                name,
+                company.get("ticker"),
             )
             company["public"] = is_public
             company["ticker"] = ticker
-
-            time.sleep(random.uniform(0.25, 0.5))
             return company
         except (
+            RequestsError,
             ValueError,
             KeyError,
             json.JSONDecodeError,
             TypeError,
         ) as e:
             logger.error(f"Scrape failed for {name}: {e}")
-            time.sleep(random.uniform(1.0, 3.0))
+            await asyncio.sleep(random.uniform(1.0, 3.0))
         return company
 
     @staticmethod
-    def _extract_website(soup: BeautifulSoup) -> str | None:
+    def _extract_website(tree: LexborHTMLParser) -> str | None:
         # Logic for website parsing only
-        for a in soup.find_all("a", href=True):
-            if "websitelink" in str(a.get("aria-describedby", "")).lower():
-                link = a.get_text(strip=True).split("?")[0].rstrip("/")
-                if link and not link.startswith("http"):
-                    link = f"https://{link}"
-                if not link or len(link) < 12:
-                    logger.error(f"Invalid website: '{link}'")
-                    link = ""
-                if link:
-                    return str(link)
-                break
+        if anchor := tree.css_first(WEBSITE_CSS):
+            link = anchor.text(strip=True).split("?")[0].rstrip("/")
+            if link and not link.startswith("http"):
+                link = f"https://{link}"
+            if not link or len(link) < 12:
+                logger.error(f"Invalid website: '{link}'")
+                link = ""
+            if link:
+                return str(link)
 
     @staticmethod
-    def _extract_headcount(soup: BeautifulSoup) -> str | None:
+    def _extract_headcount(tree: LexborHTMLParser) -> str | None:
         # Logic for emp_count only
-        size_div = soup.find("div", {"data-test-id": "about-us__size"})
-        if size_div and (dd := size_div.find("dd")):
-            return CompanyParser.get_employee_count(dd.get_text())
+        if dd := tree.css_first(SIZE_CSS):
+            return CompanyParser.get_employee_count(dd.text())
 
     @staticmethod
-    def _extract_ln_headcount(soup: BeautifulSoup) -> str | None:
+    def _extract_ln_headcount(tree: LexborHTMLParser) -> str | None:
         # Logic for ln_count only
-        cta_span = soup.find("span", {"data-test-id": "view-all-employees-cta"})
-        if cta_span and (p := cta_span.find("p")):
-            return CompanyParser.get_employee_count(p.get_text())
+        if p := tree.css_first(LN_COUNT_CSS):
+            return CompanyParser.get_employee_count(p.text())
+
+    @staticmethod
+    def parse_company_page(content: bytes) -> dict[str, Any]:
+        tree = LexborHTMLParser(content)
+        return {
+            "website": CompanyParser._extract_website(tree),
+            "emp_count": CompanyParser._extract_headcount(tree),
+            "ln_count": CompanyParser._extract_ln_headcount(tree),
+            "public": CompanyParser._extract_is_public(tree),
+        }
+
+    @staticmethod
+    def _extract_is_public(tree: LexborHTMLParser) -> bool:
+        # Logic for public or private org only
+        if dd := tree.css_first(ORG_TYPE_CSS):
+            return "public" in dd.text().lower()
+        return False
 
     @staticmethod
-    def _extract_org_type(
-        soup: BeautifulSoup, name: str, existing_ticker: str | None
+    def _resolve_ticker(
+        is_public: bool, name: str, existing_ticker: str | None
     ) -> tuple:
-        # Logic for public or private org and ticker symbol
-        is_public = False
+        # Logic for ticker symbol of public orgs
         ticker = existing_ticker
-        org_div = soup.find("div", {"data-test-id": "about-us__organizationType"})
-        if org_div and (dd := org_div.find("dd")):
-            is_public = "public" in dd.get_text().lower()
-            if is_public:
-                # ONLY call find_ticker if it's missing or empty
-                if not existing_ticker or existing_ticker == "":
-                    if CompanyParser.ticker_error_count < 50:
-                        ticker = FinancialService.find_ticker(name)
-                        if ticker:
-                            logger.info(f"New Ticker Found: {name} -> {ticker}")
-                        else:
-                            CompanyParser.ticker_error_count += 1
+        if is_public:
+            # ONLY call find_ticker if it's missing or empty
+            if not existing_ticker or existing_ticker == "":
+                if CompanyParser.ticker_error_count < 50:
+                    ticker = FinancialService.find_ticker(name)
+                    if ticker:
+                        logger.info(f"New Ticker Found: {name} -> {ticker}")
                     else:
-                        logger.info("Skipping ticker lookup!")
+                        CompanyParser.ticker_error_count += 1
                 else:
-                    logger.info(f"Ticker exists for {name}: {ticker}")
+                    logger.info("Skipping ticker lookup!")
+            else:
+                logger.info(f"Ticker exists for {name}: {ticker}")
         if existing_ticker and not ticker:
             ticker = existing_ticker
         return (is_public, ticker)
@@ -860,31 +928,9 @@ class DataCoordinator:
         logger.info("------------------------------------------------")
         start_time = time.time()
         # Parse data & Enrich
-        processed = []
-        processed_count = 0
-        total_saved = 0
-        for i, target in enumerate(url_list):
-            # Check the clock at the start of every iteration
-            elapsed = time.time() - start_time
-            if elapsed > TIME_LIMIT:
-                limit = f"({round(elapsed/3600, 2)} hours)"
-                logger.warning(f"Time limit reached :{limit}. Stopping run!")
-                break
-
-            enriched = CompanyParser.get_company_details(i, target)
-            if enriched:
-                processed.append(enriched)
-
-            # save periodically to json file
-            if (i + 1) % 100 == 0:
-                total_saved = DataCoordinator._save_to_disk(processed)
-                processed_count += len(processed)
-                processed = []
-
-        # Final save for the remaining processed data
-        if processed and len(processed) > 0:
-            total_saved = DataCoordinator._save_to_disk(processed)
-            processed_count += len(processed)
+        processed_count, total_saved = asyncio.run(
+            DataCoordinator._fetch_all_details(url_list, start_time, TIME_LIMIT)
+        )
 
         DataCoordinator.summary += f"Total updated companies: {processed_count}\n"
         DataCoordinator.summary += f"Final saved company count: **{total_saved}**\n"
@@ -894,6 +940,63 @@ class DataCoordinator:
         DataCoordinator.summary += f"Run completed in {total_time} hours.\n"
         logger.info("------------------------------------------------")
 
+    @staticmethod
+    async def _fetch_all_details(url_list, start_time, TIME_LIMIT) -> tuple:
+        """Fetch company pages concurrently, bounded by MAX_CONCURRENCY"""
+        sem = asyncio.Semaphore(MAX_CONCURRENCY)
+        time_up = False
+
+        async def bounded(session, limiter, i, target):
+            nonlocal time_up
+            async with sem:
+                # Check the clock before every fetch
+                elapsed = time.time() - start_time
+                if elapsed > TIME_LIMIT:
+                    if not time_up:
+                        limit = f"({round(elapsed/3600, 2)} hours)"
+                        logger.warning(f"Time limit reached :{limit}. Stopping run!")
+                        time_up = True
+                    return None
+                return await CompanyParser.get_company_details(
+                    session, limiter, i, target
+                )
+
+        # Load existing data once, batches are merged into it in memory
+        data_map = DataCoordinator._load_data_map()
+        history = GrowthAnalytics._load_history_file()
+
+        processed = []
+        processed_count = 0
+        total_saved = 0
+        # Token bucket keeps the average LinkedIn request rate polite
+        limiter = AsyncLimiter(LINKEDIN_MAX_RATE, 60)
+        async with AsyncSession(
+            impersonate="chrome",
+            headers={"User-Agent": USER_AGENT},
+            max_clients=MAX_CONCURRENCY,
+        ) as session:
+            tasks = [bounded(session, limiter, i, t) for i, t in enumerate(url_list)]
+            for done, task in enumerate(asyncio.as_completed(tasks), 1):
+                enriched = await task
+                if enriched:
+                    processed.append(enriched)
+
+                # save periodically to json file
+                if done % SAVE_EVERY == 0 and processed:
+                    DataCoordinator._merge_batch(data_map, history, processed)
+                    total_saved = await asyncio.to_thread(
+                        DataCoordinator._save_to_disk, data_map, history
+                    )
+                    processed_count += len(processed)
+                    processed = []
+
+        # Final save for the remaining processed data
+        if processed:
+            DataCoordinator._merge_batch(data_map, history, processed)
+            total_saved = DataCoordinator._save_to_disk(data_map, history)
+            processed_count += len(processed)
+        return processed_count, total_saved
+
     @staticmethod
     def _get_target_urls() -> list[dict]:
         targets, seen = [], set()
@@ -926,8 +1029,9 @@ class DataCoordinator:
             return targets, seen
         logger.info(f"Finding new companies from {JOBS_DATA.name}")
         comp_list = []
-        with open(JOBS_DATA, "r") as f:
-            for j in json.load(f).get("data", []):
+        # Stream the job records instead of decoding the whole file at once
+        with open(JOBS_DATA, "rb") as f:
+            for j in ijson.items(f, "data.item"):
                 url = LnSearch.normalize_url(j.get("companyUrl"))
                 handle = LnSearch.get_handle(url)
                 if not handle:
@@ -1011,9 +1115,9 @@ class DataCoordinator:
         # Check inactive companies every 10 days regardless of size
         if not company.get("active", True):
             return days_old >= 10
-        # Large companies: Refresh every day
+        # Large companies: Refresh every day, unless a rerun already refreshed them
         if ln_count > 50:
-            return True
+            return (now - last_upd) >= RECENT_REFRESH
         # Small companies (<=50): Only refresh if at least 2 days old
         return days_old >= 2
 
@@ -1021,27 +1125,44 @@ class DataCoordinator:
     def _find_new_comp(targets, seen) -> tuple:
         # Find companies from job posts
         logger.info("Finding new companies from current Linkedin jobs!")
-        comp_list = []
         # Load Keywords from txt file
-        keyword_list = [""]
+        keywords = set()
         if not KEYWORDS_FILE.exists():
             logger.warning(f"{KEYWORDS_FILE} not found. Skipping job search!")
         else:
             with open(KEYWORDS_FILE, "r") as f:
-                keyword_list += [line.strip() for line in f if line.strip()]
+                keywords = {line.strip() for line in f if line.strip()}
 
-        # Ensure keyword_list unique
-        keyword_list = list(set(keyword_list))
+        # Blank keyword searches all jobs, the set keeps every keyword unique
+        keywords.add("")
+        keyword_list = list(keywords)
         logger.info(f"Total Keywords for Searching: {len(keyword_list)}")
         # make the list randomly ordered
         random.shuffle(keyword_list)
-        for i, keyword in enumerate(keyword_list):
-            logger.info(f"Searching with keyword #{i}: '{keyword}'")
-            new_comps, seen = LnSearch.get_companies(keyword, seen)
-            comp_list += new_comps
+        comp_list, seen = asyncio.run(
+            DataCoordinator._search_keywords(keyword_list, seen)
+        )
         logger.info(f"Found total {len(comp_list)} companies from open jobs")
         return (comp_list + targets), seen
 
+    @staticmethod
+    async def _search_keywords(keyword_list, seen) -> tuple:
+        """Crawl job search results for every keyword over a single session"""
+        comp_list = []
+        limiter = AsyncLimiter(LINKEDIN_MAX_RATE, 60)
+        async with AsyncSession(
+            impersonate="chrome",
+            headers={"User-Agent": USER_AGENT},
+            http_version=CurlHttpVersion.V2_0,
+        ) as session:
+            for i, keyword in enumerate(keyword_list):
+                logger.info(f"Searching with keyword #{i}: '{keyword}'")
+                new_comps, seen = await LnSearch.get_companies(
+                    session, limiter, keyword, seen
+                )
+                comp_list += new_comps
+        return comp_list, seen
+
     @staticmethod
     def _get_indian_listed_companies(targets, seen) -> tuple:
         """Fetches, parses, and enriches official Indian listed companies with dual-listing protection."""
@@ -1063,10 +1184,11 @@ class DataCoordinator:
         # GET ALREADY KNOWN TICKERS
         known_tickers = set()
         if DATA_FILE.exists():
-            with open(DATA_FILE, "r") as f:
-                known_tickers = {
-                    c.get("ticker") for c in json.load(f) if c.get("ticker")
-                }
+            known_tickers = {
+                c.get("ticker")
+                for c in DataCoordinator._load_data_file()
+                if c.get("ticker")
+            }
 
         # FILTER: Only try to load symbols we dont already have
         new_symbols = [s for s in symbol_list if s not in known_tickers]
@@ -1130,43 +1252,42 @@ class DataCoordinator:
     def _get_symbols_from_bourse() -> list:
         """Get Public listed company ticker symbols from NSE and BSE"""
         symbols = set()
-        with requests.Session() as session:
-            # Parse NSE (Series 'EQ' only)
-            try:
-                resp = session.get(NSE_URL, impersonate="chrome", timeout=15)
-                df_nse = pd.read_csv(io.StringIO(resp.text))
-                nse_symbols = df_nse[df_nse[" SERIES"] == "EQ"]["SYMBOL"].tolist()
-                symbols.update([f"{s}.NS" for s in nse_symbols])
-                logger.info(f"Found {len(nse_symbols)} symbols from NSE")
-            except (
-                ValueError,
-                KeyError,
-                json.JSONDecodeError,
-                TypeError,
-                RequestsError, 
-                pd.errors.ParserError, 
-                pd.errors.EmptyDataError
-            ) as e:
-                logger.error(f"NSE CSV Parse Error: {e}")
+        # Parse NSE (Series 'EQ' only)
+        try:
+            resp = SESSION.get(NSE_URL, timeout=15)
+            df_nse = pd.read_csv(io.StringIO(resp.text))
+            nse_symbols = df_nse[df_nse[" SERIES"] == "EQ"]["SYMBOL"].tolist()
+            symbols.update([f"{s}.NS" for s in nse_symbols])
+            logger.info(f"Found {len(nse_symbols)} symbols from NSE")
+        except (
+            ValueError,
+            KeyError,
+            json.JSONDecodeError,
+            TypeError,
+            RequestsError, 
+            pd.errors.ParserError, 
+            pd.errors.EmptyDataError
+        ) as e:
+            logger.error(f"NSE CSV Parse Error: {e}")
 
-            #  Parse BSE (Scrip Code)
-            try:
-                resp = session.get(BSE_URL, impersonate="chrome", timeout=15)
-                csv_content = resp.text
-                df_bse = pd.read_csv(io.StringIO(csv_content))
-                #  Check if the required column is missing
-                if "Scrip code" not in df_bse.columns:
-                    df_bse = pd.read_csv(io.StringIO(csv_content), skiprows=1)
-                bse_codes = df_bse["Scrip code"].dropna().tolist()
-                symbols.update([f"{s}.BO" for s in bse_codes])
-                logger.info(f"Found {len(bse_codes)} symbols from BSE")
-            except (
-                ValueError,
-                KeyError,
-                json.JSONDecodeError,
-                TypeError,
-            ) as e:
-                logger.error(f"BSE CSV Parse Error: {e}")
+        #  Parse BSE (Scrip Code)
+        try:
+            resp = SESSION.get(BSE_URL, timeout=15)
+            csv_content = resp.text
+            df_bse = pd.read_csv(io.StringIO(csv_content))
+            #  Check if the required column is missing
+            if "Scrip code" not in df_bse.columns:
+                df_bse = pd.read_csv(io.StringIO(csv_content), skiprows=1)
+            bse_codes = df_bse["Scrip code"].dropna().tolist()
+            symbols.update([f"{s}.BO" for s in bse_codes])
+            logger.info(f"Found {len(bse_codes)} symbols from BSE")
+        except (
+            ValueError,
+            KeyError,
+            json.JSONDecodeError,
+            TypeError,
+        ) as e:
+            logger.error(f"BSE CSV Parse Error: {e}")
 
         return list(symbols)
 
@@ -1179,26 +1300,26 @@ class DataCoordinator:
 
         try:
             logger.info(f"Loading {url=}")
-            resp = requests.get(url, impersonate="chrome", timeout=10)
+            resp = SESSION.get(url, timeout=10)
             if resp.status_code != 200:
                 logger.error(f"Error fetching {url=} | Status: {resp.status_code}")
                 return None
 
-            soup = BeautifulSoup(resp.text, "html.parser")
+            tree = LexborHTMLParser(resp.content)
 
             # Extract Website Link
             website = None
-            links_container = soup.find("div", class_="company-links")
-            if links_container and (a_tag := links_container.find("a", href=True)):
-                website = a_tag["href"].strip().split("?")[0].rstrip("/")
+            if a_tag := tree.css_first("div.company-links a[href]"):
+                href = a_tag.attributes["href"] or ""
+                website = href.strip().split("?")[0].rstrip("/")
 
             if not website:
                 logger.error(f"Website NOT found in {url=}")
                 return None
 
             # Get Name
-            name_tag = soup.find("h1")
-            name = name_tag.get_text(strip=True) if name_tag else ticker
+            name_tag = tree.css_first("h1")
+            name = name_tag.text(strip=True) if name_tag else ticker
 
             # Find LinkedIn from the company website
             li_url = DataCoordinator._find_linkedin_on_website(website)
@@ -1223,10 +1344,10 @@ class DataCoordinator:
         return None
 
     @staticmethod
-    def _extract_linkedin_url(soup: BeautifulSoup) -> str | None:
-        """Helper to find a LinkedIn company link within a soup object."""
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
+    def _extract_linkedin_url(tree: LexborHTMLParser) -> str | None:
+        """Helper to find a LinkedIn company link within a parsed page."""
+        for a in tree.css("a[href]"):
+            href = a.attributes["href"] or ""
             if "linkedin.com/company/" in href:
                 # Everything after "company/"
                 base, _, tail = href.partition("company/")
@@ -1240,15 +1361,15 @@ class DataCoordinator:
         """Scans homepage and optionally a contact page for LinkedIn links."""
         try:
             logger.info(f"Loading {url=}")
-            resp = requests.get(url, impersonate="chrome", timeout=20)
+            resp = SESSION.get(url, timeout=20)
             if resp.status_code != 200:
                 logger.warning(f"Error loading {url}")
                 return None
 
-            soup = BeautifulSoup(resp.text, "html.parser")
+            tree = LexborHTMLParser(resp.content)
 
             # Try to find it on the homepage immediately
-            if link := DataCoordinator._extract_linkedin_url(soup):
+            if link := DataCoordinator._extract_linkedin_url(tree):
                 return link
 
             # If not found, look for a contact/about page link
@@ -1271,8 +1392,8 @@ class DataCoordinator:
             ]
             contact_urls = []
             parsed_uri = urlparse(url)
-            for a in soup.find_all("a", href=True):
-                href = a["href"].lower()
+            for a in tree.css("a[href]"):
+                href = (a.attributes["href"] or "").lower()
                 # Handle relative URLs (e.g., /contact -> https://site.com/contact)
                 full_url = urljoin(url, href)
                 # skip if url found is not of current site
@@ -1289,12 +1410,10 @@ class DataCoordinator:
                 for contact_url in contact_urls[:10]:
                     if contact_url != url:
                         logger.info(f"Loading {contact_url=}")
-                        c_resp = requests.get(
-                            contact_url, impersonate="chrome", timeout=20
-                        )
+                        c_resp = SESSION.get(contact_url, timeout=20)
                         if c_resp.status_code == 200:
-                            c_soup = BeautifulSoup(c_resp.text, "html.parser")
-                            if ln := DataCoordinator._extract_linkedin_url(c_soup):
+                            c_tree = LexborHTMLParser(c_resp.content)
+                            if ln := DataCoordinator._extract_linkedin_url(c_tree):
                                 return ln
 
         except (
@@ -1319,9 +1438,9 @@ class DataCoordinator:
                 temp_data = json.load(f)
             master_list = DataCoordinator._load_data_file()
             master_map = {
-                LnSearch.get_handle(c.get("linkedin")): c
+                handle: c
                 for c in master_list
-                if LnSearch.get_handle(c.get("linkedin"))
+                if (handle := LnSearch.get_handle(c.get("linkedin")))
             }
             updated_count = 0
             for item in temp_data:
@@ -1335,8 +1454,7 @@ class DataCoordinator:
                     updated_count += 1
 
             if updated_count > 0:
-                with open(DATA_FILE, "w") as f:
-                    json.dump(list(master_map.values()), f, indent=2)
+                DataCoordinator._write_data_file(list(master_map.values()))
                 logger.info(f"Sync complete: Updated {updated_count} companies.")
         except (
             ValueError,
@@ -1349,29 +1467,35 @@ class DataCoordinator:
     @staticmethod
     def _load_data_file() -> list:
         if DATA_FILE.exists():
-            with open(DATA_FILE, "r") as f:
-                return json.load(f)
+            return orjson.loads(DATA_FILE.read_bytes())
         else:
             logger.warning(f"{DATA_FILE} file not found")
         return []
 
     @staticmethod
-    def _save_to_disk(new_batch: list[dict], last_updated_date=True) -> int:
-        if not new_batch:
-            return 0
+    def _write_data_file(data: list) -> None:
+        """Serialize with orjson to a temp file and swap it in atomically"""
+        DATA_TMP_FILE.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        os.replace(DATA_TMP_FILE, DATA_FILE)
 
-        # Load existing data
-        current_data = DataCoordinator._load_data_file()
-        # Read history file
-        history = GrowthAnalytics._load_history_file()
-
-        # map each entry based on LinkedIn HANDLE
-        data_map = {}
-        for c in current_data:
-            handle = LnSearch.get_handle(c.get("linkedin", ""))
-            if handle:
-                data_map[handle] = c
+    @staticmethod
+    def _load_data_map() -> dict:
+        """Map each existing entry based on LinkedIn HANDLE"""
+        # Build the dict in a single comprehension instead of growing it per item
+        return {
+            handle: c
+            for c in DataCoordinator._load_data_file()
+            if (handle := LnSearch.get_handle(c.get("linkedin", "")))
+        }
 
+    @staticmethod
+    def _merge_batch(
+        data_map: dict, history: dict, new_batch: list[dict], last_updated_date=True
+    ) -> None:
+        """Merge newly scraped companies into data_map and log their headcount"""
+        # One timestamp for the whole batch
+        now_iso = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        now_iso = now_iso.replace("+00:00", "Z")
         for item in new_batch:
             # Clean the item: Remove keys where value is None or "null" string
             clean = {k: v for k, v in item.items() if v is not None}
@@ -1385,20 +1509,21 @@ class DataCoordinator:
             ln_count = clean.get("ln_count")
             # Log History for Calculating Trends
             if handle and ln_count and str(ln_count).isdigit():
-                history = GrowthAnalytics.log_headcount(history, handle, int(ln_count))
+                GrowthAnalytics.log_headcount(history, handle, int(ln_count))
 
             # Merge based on Handle
             if handle in data_map:
                 data_map[handle].update(clean)
                 if last_updated_date:
-                    t = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-                    data_map[handle]["last_updated"] = t
+                    data_map[handle]["last_updated"] = now_iso
             else:
                 if last_updated_date:
-                    t = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-                    clean["last_updated"] = t
+                    clean["last_updated"] = now_iso
                 data_map[handle] = clean
 
+    @staticmethod
+    def _save_to_disk(data_map: dict, history: dict) -> int:
+        """Write the merged companies and headcount history, without re-reading"""
         # Save headcount history file
         GrowthAnalytics._save_history_file(history)
 
@@ -1408,41 +1533,32 @@ class DataCoordinator:
             final_list.append({k: v for k, v in entry.items() if v is not None})
 
         # Sorting logic: Descending count (NaNs at end), Ascending Name
-        def sort_logic(x):
-            cnt = x.get("emp_count")
-            ln_cnt = x.get("ln_count")
-            # count is either a range "5001-10000", a single number "10000", or missing
-            if not cnt:
-                # Treat missing counts as smallest
-                val = float("inf")
-            elif "-" in cnt:
-                # Use upper bound of range for sorting
-                val = -int(cnt.split("-")[1])
-            elif cnt.endswith("+"):
-                val = cnt.strip("+")
-                if val.isdigit():
-                    val = -int(val)
-            elif cnt.isdigit():
-                val = -int(cnt)
-            elif ln_cnt and ln_cnt.isdigit():
-                val = -int(ln_cnt)
-            else:
-                # Unrecognized format, treat as smallest
-                val = float("inf")
-            # sorting key variables
-            if ln_cnt and ln_cnt.isdigit():
-                ln_cnt = -int(ln_cnt)
-                return (ln_cnt, val, x["name"].lower())
-            else:
-                return (0, val, x["name"].lower())
+        # Keys are computed in one pass, the sort then only compares plain tuples
+        keys = [(DataCoordinator._sort_key(c), i) for i, c in enumerate(final_list)]
+        keys.sort()
 
         # Final Sort and Save
-        final = sorted(final_list, key=sort_logic)
-        with open(DATA_FILE, "w") as f:
-            json.dump(final, f, indent=2)
+        final = [final_list[i] for _, i in keys]
+        DataCoordinator._write_data_file(final)
         logger.info(f"Saved {len(final)} unique companies to {DATA_FILE}")
         return len(final)
 
+    @staticmethod
+    def _sort_key(company: dict) -> tuple:
+        """Sort by LinkedIn count, then upper bound of emp_count, then name"""
+        cnt = company.get("emp_count")
+        ln_cnt = company.get("ln_count")
+        ln_val = -int(ln_cnt) if ln_cnt and ln_cnt.isdigit() else None
+        # count is either a range "5001-10000", "10000+", a single number or missing
+        if cnt and (m := COUNT_BOUND_RE.search(cnt)):
+            val = -int(m.group(1))
+        elif cnt and ln_val is not None:
+            val = ln_val
+        else:
+            # Missing or unrecognized format, treat as smallest
+            val = float("inf")
+        return (ln_val or 0, val, company["name"].lower())
+
     @staticmethod
     def update_all_trends() -> None:
         """Calculates employee count trends and sparklines for ALL companies."""
@@ -1481,8 +1597,7 @@ class DataCoordinator:
                 company.pop("sparkline", None)
 
         # Save back to disk once
-        with open(DATA_FILE, "w") as f:
-            json.dump(companies, f, indent=2)
+        DataCoordinator._write_data_file(companies)
         logger.info("Global trend recalculation complete!")
 
     @staticmethod
@@ -1,12 +1,13 @@
-import io
 import json
 import logging
+import os
 import re
 import time
 from pathlib import Path
 from typing import Any
 
-import pdfplumber
+import pymupdf
+import utils
 from playwright.sync_api import sync_playwright
 
 # --- Configuration & Logging Setup ---
@@ -28,16 +29,36 @@ PROJECT_ROOT = SCRIPT_DIR.parent
 DATA_DIR = PROJECT_ROOT / "data"
 SOURCE_FILE = DATA_DIR / "sources.json"
 OUTPUT_FILENAME = DATA_DIR / (COMPANY + " Excluded_Hospitals_List.json")
-TEMP_PDF_PATH = DATA_DIR / "aditya_birla_temp.pdf"
+# Parsed rows keyed by the PDF's sha256, reused while the upstream PDF is unchanged
+CACHE_DIR = DATA_DIR / ".cache"
+# Part of the cache key, bump it when a parsing change alters the cached rows
+PARSER_VERSION = 1
 
 # Ensure data directory exists
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
+# 'x_tolerance': Higher value (10-15) prevents splitting "Hospital" into "Hos | pital"
+TABLE_SETTINGS = {
+    "vertical_strategy": "lines",
+    "horizontal_strategy": "lines",
+    "snap_tolerance": 4,
+}
+
+# Rows need at least Name, Address, City, State and Pin columns
+MIN_COLUMNS = 5
+
+# Page resources the exclusion link does not need, skipped in the browser
+BLOCKED_RESOURCES = {"image", "stylesheet", "font", "media"}
+
+# Serial number merged into the front of a name cell
+SERIAL_PREFIX_RE = re.compile(r"^\d+\s")
+
 
 def clean_text(text: Any) -> str:
     if not text:
         return ""
-    return re.sub(r"\s+", " ", str(text)).strip()
+    # split() collapses every whitespace run and trims the ends in one C pass
+    return " ".join(str(text).split())
 
 
 def get_source_url(company_name: str, url_key: str) -> str:
@@ -64,23 +85,36 @@ def get_source_url(company_name: str, url_key: str) -> str:
     return url
 
 
-def download_pdf_via_browser(url) -> bool:
+def block_resources(route) -> None:
+    """Aborts requests for heavy page resources, lets the rest through."""
+    if route.request.resource_type in BLOCKED_RESOURCES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+def download_pdf_via_browser(url) -> bytes | None:
     """
-    Navigates to the page, clicks the link, and captures the downloaded file.
+    Navigates to the page, clicks the link, and returns the downloaded file.
     """
-    pdf_download = False
+    pdf_bytes = None
 
     with sync_playwright() as p:
         logger.info(f"Launching browser for {COMPANY}...")
-        browser = p.chromium.launch(headless=False)
+        browser = p.chromium.launch(
+            headless=True,
+            args=["--disable-gpu", "--no-sandbox", "--disable-dev-shm-usage"],
+        )
 
         # Grant download permissions
         context = browser.new_context(accept_downloads=True)
+        context.route("**/*", block_resources)
         page = context.new_page()
 
         try:
             logger.info(f"Navigating to {url}")
-            page.goto(url, timeout=60000, wait_until="domcontentloaded")
+            # The link is awaited below, so navigation only needs to commit
+            page.goto(url, timeout=60000, wait_until="commit")
             time.sleep(2)
 
             # 1. Locate the Link
@@ -96,10 +130,9 @@ def download_pdf_via_browser(url) -> bool:
                 time.sleep(2)
             download = download_info.value
 
-            # 3. Save to Disk
+            # 3. Read the browser's download file once, it is removed on close
             logger.info(f"Download started: {download.suggested_filename}")
-            download.save_as(TEMP_PDF_PATH)
-            time.sleep(2)
+            pdf_bytes = Path(download.path()).read_bytes()
 
         except (
             OSError,
@@ -113,10 +146,45 @@ def download_pdf_via_browser(url) -> bool:
         finally:
             browser.close()
 
-    if TEMP_PDF_PATH.exists():
-        pdf_download = True
+    return pdf_bytes
+
+
+def extract_tables_pymupdf(
+    page: pymupdf.Page, clip: pymupdf.Rect | None, table_settings: dict
+) -> list[list[list[str | None]]]:
+    """Finds the ruled tables on a page and returns their rows of cell text."""
+    finder = page.find_tables(clip=clip, **table_settings)
+    # Narrower tables never yield a record, skip them before reading any text
+    tables = [t for t in finder.tables if t.col_count >= MIN_COLUMNS]
+    if not tables:
+        return []
+    # Words come from the clipped text page find_tables already built, so the
+    # page text is read once and each cell then only checks nearby tiles
+    grid = utils.bucket_words(page.get_text("words", textpage=finder.textpage))
+    return [utils.extract_rows(table, grid) for table in tables]
+
+
+def extract_one_page(page_index: int) -> list[list[list[str | None]]]:
+    """Extracts the tables of one page inside a worker process."""
+    page = utils.worker_pdf[page_index]
+    clip = None
 
-    return pdf_download
+    # Crop Page 1 Header 0 skip the top 25% of the first page to ignore the text
+    if page_index == 0:
+        width = page.rect.width
+        height = page.rect.height
+        # Clip box: (x0, top, x1, bottom)
+        # We start 25% down the page (approx 200 units)
+        clip = pymupdf.Rect(0, height * 0.25, width, height)
+
+    return extract_tables_pymupdf(page, clip, TABLE_SETTINGS)
+
+
+def is_header_row(row: list[str | None]) -> bool:
+    """Checks a table's first row for the Provider/Pincode column titles."""
+    name = clean_text(row[1]).upper() if len(row) > 1 else ""
+    pin = clean_text(row[-1]).upper() if row else ""
+    return "PROVIDER" in name or "PINCODE" in pin
 
 
 def parse_pdf_content(pdf_bytes: bytes) -> list[dict]:
@@ -129,51 +197,34 @@ def parse_pdf_content(pdf_bytes: bytes) -> list[dict]:
     if not pdf_bytes:
         return data_list
 
-    # 'x_tolerance': Higher value (10-15) prevents splitting "Hospital" into "Hos | pital"
-    table_settings = {
-        "vertical_strategy": "lines",
-        "horizontal_strategy": "lines",
-        "snap_tolerance": 4,
-    }
-
     try:
-        with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-            logger.info(f"Parsing {len(pdf.pages)} pages...")
-
-            for i, page in enumerate(pdf.pages):
-                target_page = page
-
-                # Crop Page 1 Header 0 skip the top 25% of the first page to ignore the text
-                if i == 0:
-                    width = page.width
-                    height = page.height
-                    # Crop box: (x0, top, x1, bottom)
-                    # We start 25% down the page (approx 200 units)
-                    target_page = page.crop((0, height * 0.25, width, height))
-
-                tables = target_page.extract_tables(table_settings)
-
+        with pymupdf.open(stream=pdf_bytes, filetype="pdf") as pdf:
+            page_count = pdf.page_count
+        logger.info(f"Parsing {page_count} pages...")
+
+        # Table extraction is CPU bound and independent per page, results stay in order
+        workers = max(1, min(os.cpu_count() or 1, page_count))
+        with utils.MP_CONTEXT.Pool(
+            workers, utils.init_pdf_worker, (pdf_bytes,)
+        ) as pool:
+            for tables in pool.imap(extract_one_page, range(page_count)):
                 for table in tables:
-                    for row in table:
+                    # Skip Headers, they only sit in the first row of a table
+                    start = 1 if table and is_header_row(table[0]) else 0
+                    for row in table[start:]:
                         clean_row = [clean_text(cell) for cell in row]
 
                         if not any(clean_row):
                             continue
 
-                        # Skip Headers
-                        if (
-                            "PROVIDER" in clean_row[1].upper()
-                            or "PINCODE" in clean_row[-1].upper()
-                        ):
-                            continue
-
                         # --- MAPPING LOGIC ---
                         # Standard Row: S.No | Name | Address | City | State | Pin
 
                         # 1Validate Pincode (Crucial Filter)
                         # This filters out any lingering text rows like "expenses incurred..."
                         raw_pin = clean_row[-1]
-                        if not (raw_pin.isdigit() and len(raw_pin) == 6):
+                        # The length test rejects most rows before isdigit walks them
+                        if not (len(raw_pin) == 6 and raw_pin.isdigit()):
                             continue
 
                         pincode = raw_pin
@@ -189,7 +240,7 @@ def parse_pdf_content(pdf_bytes: bytes) -> list[dict]:
                             # S.No might be merged with Name: [0] "1 Hospital Name"
                             # Or Name merged with Address
                             # Heuristic: Check if col[0] starts with digits
-                            if re.match(r"^\d+\s", clean_row[0]):
+                            if SERIAL_PREFIX_RE.match(clean_row[0]):
                                 # Split "123 Apollo Hospital"
                                 parts = clean_row[0].split(" ", 1)
                                 name = parts[1] if len(parts) > 1 else clean_row[0]
@@ -214,6 +265,7 @@ def parse_pdf_content(pdf_bytes: bytes) -> list[dict]:
 
     except (
         OSError,
+        RuntimeError,
         ValueError,
         KeyError,
         TypeError,
@@ -229,19 +281,21 @@ def main():
     if not target_url:
         return
 
-    pdf = download_pdf_via_browser(target_url)
-    if not pdf:
+    pdf_content = download_pdf_via_browser(target_url)
+    if not pdf_content:
         logger.error("Download failed.")
         return
-
-    # Read PDF into memory
-    pdf_content = None
-    with open(TEMP_PDF_PATH, "rb") as f:
-        pdf_content = f.read()
     logger.info(f"PDF read: ({len(pdf_content)} bytes).")
 
-    # 2. Parse
-    cleaned_data = parse_pdf_content(pdf_content)
+    # 2. Parse, unless this exact PDF was parsed before
+    cache_path = utils.get_cache_path(CACHE_DIR, COMPANY, pdf_content, PARSER_VERSION)
+    cleaned_data = utils.load_parse_cache(cache_path)
+    if cleaned_data is not None:
+        logger.info(f"Unchanged PDF, loaded records from {cache_path.name}")
+    else:
+        cleaned_data = parse_pdf_content(pdf_content)
+        if cleaned_data:
+            utils.save_parse_cache(cache_path, COMPANY, cleaned_data)
     logger.info(f"Extracted {len(cleaned_data)} records.")
 
     # 3. Save
@@ -250,10 +304,6 @@ def main():
             with open(OUTPUT_FILENAME, "w", encoding="utf-8") as f:
                 json.dump(cleaned_data, f, indent=4, ensure_ascii=False)
             logger.info(f"Saved to {OUTPUT_FILENAME}")
-
-            # Clean up temp file if json save successful
-            if TEMP_PDF_PATH.exists():
-                TEMP_PDF_PATH.unlink()
         except (
             OSError,
             ValueError,
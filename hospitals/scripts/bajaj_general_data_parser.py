@@ -1,9 +1,11 @@
 import json
 import logging
-import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import repeat
 from pathlib import Path
-from typing import Any
 
+import pandas as pd
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -39,6 +41,16 @@ HEADERS = {
     "Referer": "https://www.bajajgeneralinsurance.com/",
     "Accept": "application/json, text/javascript, */*; q=0.01",
 }
+MAX_WORKERS = 8  # Parallel API calls within a state
+
+# Response keys in output field order
+FIELD_MAP = {
+    "stringval2": "Hospital Name",
+    "stringval3": "Address",
+    "stringval6": "City",
+    "stringval5": "State",
+    "stringval7": "Pin Code",
+}
 
 
 # --- Network Helpers ---
@@ -49,23 +61,23 @@ def get_session() -> requests.Session:
     retries = Retry(
         total=5,
         backoff_factor=2,
-        status_forcelist=[500, 502, 503, 504],
+        # Back off only when the server pushes back (429/5xx), honouring
+        # Retry-After, instead of sleeping after every healthy call
+        status_forcelist=[429, 500, 502, 503, 504],
         allowed_methods=["HEAD", "GET", "POST"],
+        backoff_max=30,
     )
-    session.mount("https://", HTTPAdapter(max_retries=retries))
+    # Pool sized above MAX_WORKERS so every worker keeps a warm keep-alive connection
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retries)
+    session.mount("https://", adapter)
     return session
 
 
-def clean_text(text: Any) -> str:
-    """Standardizes text and handles string 'null'."""
-    if not text:
-        return ""
-    text_str = str(text).strip()
-    if text_str.lower() == "null":
-        return ""
+def clean_column(col: pd.Series) -> pd.Series:
+    """Standardizes a text column and handles string 'null'."""
     # Remove excessive whitespace and standardize case
-    cleaned = " ".join(text_str.split())
-    return cleaned.title()
+    text = col.fillna("").astype(str).str.split().str.join(" ")
+    return text.mask(text.str.lower() == "null", "").str.title()
 
 
 def send_request(session: requests.Session, endpoint: str, request_json: dict) -> dict:
@@ -111,7 +123,7 @@ def send_request(session: requests.Session, endpoint: str, request_json: dict) -
 
 
 # --- Parsing Helpers ---
-def transform_hospital_data(raw_item: dict) -> dict | None:
+def transform_hospital_data(raw_items: list[dict]) -> list[dict]:
     """
     Maps the specific 'stringval' keys from the response to standard format.
     Based on sample:
@@ -121,27 +133,21 @@ def transform_hospital_data(raw_item: dict) -> dict | None:
     stringval6: City
     stringval7: Pincode
     stringval8: Status/Date (e.g. "Lapsed")
+    All items are cleaned together, column by column.
     """
-    # 1. Extract raw values
-    name = raw_item.get("stringval2")
-    address = raw_item.get("stringval3")
-    state = raw_item.get("stringval5")
-    city = raw_item.get("stringval6")
-    pincode = raw_item.get("stringval7")
-
-    clean_name = clean_text(name)
-
-    if not clean_name:
-        return None
-
-    # 2. Build Record
-    return {
-        "Hospital Name": clean_name,
-        "Address": clean_text(address),
-        "City": clean_text(city),
-        "State": clean_text(state),
-        "Pin Code": clean_text(pincode),
+    if not raw_items:
+        return []
+
+    # Only the mapped keys are pulled, one list per column, so pandas neither
+    # scans every response key nor transposes rows into columns
+    columns = {
+        field: [item.get(key) for item in raw_items] for key, field in FIELD_MAP.items()
     }
+    df = pd.DataFrame(columns).apply(clean_column)
+
+    # Drop records without a name
+    df = df[df["Hospital Name"] != ""]
+    return df.to_dict("records")
 
 
 # --- Core Logic ---
@@ -189,7 +195,7 @@ def get_cities(session: requests.Session, state: str) -> list[str]:
             item.get("stringval1") for item in city_list if item.get("stringval1")
         ]
         cities = [c for c in cities if c and c != "null"]
-        logger.info(f"Found {len(cities)} cities in {state}")
+        logger.debug("Found %d cities in %s", len(cities), state)
         return sorted(cities)
     except (
         requests.RequestException,
@@ -213,7 +219,7 @@ def get_pincodes(session: requests.Session, state: str, city: str) -> list[str]:
         pin_list = data.get("responseJson", {}).get("pinCodeList", [])
         pins = [item.get("stringval1") for item in pin_list if item.get("stringval1")]
         pins = [p for p in pins if p and p != "null"]
-        logger.info(f"Found {len(pins)} pincodes in {city}, {state}")
+        logger.debug("Found %d pincodes in %s, %s", len(pins), city, state)
         return sorted(pins)
     except (
         requests.RequestException,
@@ -229,7 +235,7 @@ def get_pincodes(session: requests.Session, state: str, city: str) -> list[str]:
 def get_hospital_details(
     session: requests.Session, state: str, city: str, pincode: str
 ) -> list[dict]:
-    """Fetches hospital details."""
+    """Fetches the raw hospital items of a pincode."""
     # Payload: {"requestJson":{"hospitalName":"", "pinCode":"...", "stateName":"...", "cityName":"..."},...}
     req_json = {
         "hospitalName": "",
@@ -242,14 +248,7 @@ def get_hospital_details(
 
     try:
         # Path: responseJson -> weoSuspectedList
-        raw_list = data.get("responseJson", {}).get("weoSuspectedList", [])
-
-        hospitals = []
-        for item in raw_list:
-            rec = transform_hospital_data(item)
-            if rec:
-                hospitals.append(rec)
-        return hospitals
+        return data.get("responseJson", {}).get("weoSuspectedList", [])
     except (
         requests.RequestException,
         ValueError,
@@ -261,56 +260,84 @@ def get_hospital_details(
         return []
 
 
+def fetch_pin_hospitals(
+    session: requests.Session, state: str, city: str, pin: str
+) -> list[dict]:
+    """Fetches hospitals for one pincode."""
+    hospitals = get_hospital_details(session, state, city, pin)
+    if hospitals:
+        logger.debug("Found %d hospitals in %s", len(hospitals), pin)
+    return hospitals
+
+
 def main():
     logger.info(f"Starting Scraper for {COMPANY}...")
+    # One session for the whole run keeps TCP and TLS connections alive
     session = get_session()
 
     # 1. Get States
     states = get_states(session)
-    session.close()
     if not states:
         logger.error("No states found. Exiting.")
+        session.close()
         return
 
-    all_data = []
-
-    # 2. Iterate States
-    for i, state in enumerate(states):
-        logger.info(f"[{i+1}/{len(states)}] Processing State: {state}")
-
-        # Create a FRESH session for every State.
-        state_session = get_session()
-
-        try:
-            cities = get_cities(state_session, state)
-            if not cities:
-                logger.info(f"Found 0 cities in {state}")
-                continue
-
-            for city in cities:
-                pincodes = get_pincodes(state_session, state, city)
-                # If no pincodes, we can't query details successfully
-                if not pincodes:
-                    logger.warning(f"No pincodes for {city}, skipping.")
+    raw_items = []
+    # Totals reported once at the end instead of per city and pincode
+    city_count = 0
+    pin_count = 0
+
+    # API calls are network bound, a small worker pool overlaps their round trips
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        # 2. Iterate States
+        for i, state in enumerate(states):
+            logger.info(f"[{i+1}/{len(states)}] Processing State: {state}")
+
+            try:
+                cities = get_cities(session, state)
+                if not cities:
+                    logger.debug("Found 0 cities in %s", state)
                     continue
+                city_count += len(cities)
+
+                # Pincode lists of all cities are fetched together
+                pin_lists = pool.map(partial(get_pincodes, session, state), cities)
+
+                jobs = []
+                for city, pincodes in zip(cities, pin_lists):
+                    # If no pincodes, we can't query details successfully
+                    if not pincodes:
+                        logger.debug("No pincodes for %s, skipping.", city)
+                        continue
+                    jobs.extend((city, pin.strip()) for pin in pincodes)
+                pin_count += len(jobs)
+
+                # map keeps the pincode order, so the output order is unchanged
+                results = pool.map(
+                    fetch_pin_hospitals,
+                    repeat(session),
+                    repeat(state),
+                    [city for city, _ in jobs],
+                    [pin for _, pin in jobs],
+                )
+                for hospitals in results:
+                    raw_items.extend(hospitals)
+            except (
+                requests.RequestException,
+                ValueError,
+                KeyError,
+                json.JSONDecodeError,
+                TypeError,
+            ) as e:
+                logger.error(f"Error processing state {state}: {e}")
+    session.close()
+    logger.info(
+        f"Scanned {len(states)} states, {city_count} cities and {pin_count} pincodes, "
+        f"found {len(raw_items)} hospitals."
+    )
 
-                for pin in pincodes:
-                    pin = pin.strip()
-                    hospitals = get_hospital_details(state_session, state, city, pin)
-                    if hospitals:
-                        all_data.extend(hospitals)
-                        logger.info(f"Found {len(hospitals)} hospitals in {pin}")
-                    time.sleep(1)  # Small delay
-        except (
-            requests.RequestException,
-            ValueError,
-            KeyError,
-            json.JSONDecodeError,
-            TypeError,
-        ) as e:
-            logger.error(f"Error processing state {state}: {e}")
-        finally:
-            state_session.close()
+    # 5. Clean all records in one vectorized pass
+    all_data = transform_hospital_data(raw_items)
 
     # 6. Save Results
     if all_data:
@@ -1,14 +1,15 @@
-import io
+import html
 import json
 import logging
+import os
 import re
 from pathlib import Path
 from typing import Any
 from urllib.parse import urljoin, urlparse
 
-import pdfplumber
+import pymupdf
 import requests
-from bs4 import BeautifulSoup
+import utils
 from requests.exceptions import RequestException
 
 # --- Configuration & Logging Setup ---
@@ -26,6 +27,10 @@ PROJECT_ROOT = SCRIPT_DIR.parent
 DATA_DIR = PROJECT_ROOT / "data"
 SOURCE_FILE = DATA_DIR / "sources.json"
 OUTPUT_FILENAME = DATA_DIR / (COMPANY + " Excluded_Hospitals_List.json")
+# Parsed rows keyed by the PDF's sha256, reused while the upstream PDF is unchanged
+CACHE_DIR = DATA_DIR / ".cache"
+# Part of the cache key, bump it when a parsing change alters the cached rows
+PARSER_VERSION = 1
 
 # Ensure data directory exists
 DATA_DIR.mkdir(parents=True, exist_ok=True)
@@ -49,6 +54,28 @@ HEADERS = {
     "referer": "https://www.google.com/",
 }
 
+# Strict settings to catch the grid lines
+TABLE_SETTINGS = {
+    "vertical_strategy": "lines",
+    "horizontal_strategy": "lines",
+    "snap_tolerance": 4,
+}
+
+# Precompiled patterns for city and address cleanup
+DETACHED_LETTER_RE = re.compile(r"([A-Za-z]{3,})\s+([A-Za-z]{0,4})$")
+COMMA_RE = re.compile(r"\s*,[\s,]*")
+WS_RE = re.compile(r"\s+")
+# href of an <a> tag, double, single or unquoted, matched on the raw bytes
+A_HREF_RE = re.compile(
+    rb"""<a\s(?:[^>]*?\s)?href\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))(?=[^>]*>)""",
+    re.IGNORECASE,
+)
+
+# Crop boxes of the worker PDF's first page geometry (first page, other
+# pages), set up in each worker process by init_pdf_worker
+worker_rect = None
+worker_clips = None
+
 # --- COLUMN MAPPING ---
 # The order of valid data columns in the PDF table
 COLUMN_ORDER = [
@@ -60,6 +87,7 @@ COLUMN_ORDER = [
     "Location",
     "Pin Code",
 ]
+BLANK_COLUMNS = [""] * len(COLUMN_ORDER)
 
 
 def clean_text(text: Any) -> str:
@@ -112,16 +140,15 @@ def fetch_url_content(url: str) -> bytes | None:
 
 def find_pdf_link(base_url: str, html_content: bytes) -> str | None:
     try:
-        soup = BeautifulSoup(html_content, "html.parser")
-        # Look for PDF links containing 'list' or 'exclude'
-        link = soup.find(
-            "a",
-            href=lambda h: h
-            and h.lower().endswith(".pdf")
-            and ("list" in h.lower() or "exclude" in h.lower()),
-        )
-        if link:
-            return urljoin(base_url, link["href"])
+        # Look for PDF links containing 'list' or 'exclude', no DOM is needed
+        for m in A_HREF_RE.finditer(html_content):
+            # Only one of the quoting alternatives matched
+            href = html.unescape(m.group(m.lastindex).decode(errors="replace"))
+            href_lower = href.lower()
+            if href_lower.endswith(".pdf") and (
+                "list" in href_lower or "exclude" in href_lower
+            ):
+                return urljoin(base_url, href)
         return None
     except (
         requests.RequestException,
@@ -133,6 +160,55 @@ def find_pdf_link(base_url: str, html_content: bytes) -> str | None:
         return None
 
 
+def extract_table_pymupdf(
+    page: pymupdf.Page, clip: pymupdf.Rect, table_settings: dict
+) -> list[list[str | None]] | None:
+    """Returns the rows of the largest ruled table on a page, like pdfplumber did."""
+    finder = page.find_tables(clip=clip, **table_settings)
+    tables = finder.tables
+    if not tables:
+        return None
+    largest = min(tables, key=lambda t: (-len(t.cells), t.bbox[1], t.bbox[0]))
+    # Words come from the clipped text page find_tables already built, so the
+    # page text is read once and each cell then only checks nearby tiles
+    grid = utils.bucket_words(page.get_text("words", textpage=finder.textpage))
+    return utils.extract_rows(largest, grid)
+
+
+def get_page_clip(rect: pymupdf.Rect, first_page: bool) -> pymupdf.Rect:
+    """Crop Headers/Footers (Top 250px on page 1, 10px on others)."""
+    top_crop = 250 if first_page else 10
+    return pymupdf.Rect(0, top_crop, rect.width, rect.height - 10)
+
+
+def init_pdf_worker(pdf_bytes: bytes) -> None:
+    """Opens the PDF once per worker process and precomputes its crop boxes."""
+    global worker_rect, worker_clips
+    utils.init_pdf_worker(pdf_bytes)
+    # Pages almost always share the first page's size, so both boxes are
+    # built once here instead of on every page
+    worker_rect = utils.worker_pdf[0].rect
+    worker_clips = (
+        get_page_clip(worker_rect, True),
+        get_page_clip(worker_rect, False),
+    )
+
+
+def extract_one_page(page_index: int) -> list[list[str | None]] | None:
+    """Extracts the main table of one page inside a worker process."""
+    page = utils.worker_pdf[page_index]
+    first_page = page_index == 0
+    if page.rect == worker_rect:
+        clip = worker_clips[0 if first_page else 1]
+    else:
+        clip = get_page_clip(page.rect, first_page)
+
+    try:
+        return extract_table_pymupdf(page, clip, TABLE_SETTINGS)
+    except ValueError:
+        return None
+
+
 # --- Core Extraction (Returns List of Lists) ---
 def extract_raw_data_from_pdf(pdf_bytes: bytes) -> list[list[str]]:
     """
@@ -142,29 +218,16 @@ def extract_raw_data_from_pdf(pdf_bytes: bytes) -> list[list[str]]:
     """
     all_rows = []
 
-    # Strict settings to catch the grid lines
-    TABLE_SETTINGS = {
-        "vertical_strategy": "lines",
-        "horizontal_strategy": "lines",
-        "snap_tolerance": 4,
-    }
-
     try:
-        with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-            logger.info(f"Processing PDF with {len(pdf.pages)} pages...")
-
-            for i, page in enumerate(pdf.pages):
-                # Crop Headers/Footers (Top 250px on page 1, 50px on others)
-                width = page.width
-                height = page.height
-                top_crop = 250 if i == 0 else 10
-
-                try:
-                    cropped_page = page.crop((0, top_crop, width, height - 10))
-                    table = cropped_page.extract_table(TABLE_SETTINGS)
-                except ValueError:
-                    continue
-
+        with pymupdf.open(stream=pdf_bytes, filetype="pdf") as pdf:
+            page_count = pdf.page_count
+        logger.info(f"Processing PDF with {page_count} pages...")
+
+        # Pages are extracted in parallel but consumed in order, so the
+        # Doctors section still stops the run (and the pool) early
+        workers = max(1, min(os.cpu_count() or 1, page_count))
+        with utils.MP_CONTEXT.Pool(workers, init_pdf_worker, (pdf_bytes,)) as pool:
+            for i, table in enumerate(pool.imap(extract_one_page, range(page_count))):
                 if not table:
                     continue
 
@@ -202,6 +265,7 @@ def extract_raw_data_from_pdf(pdf_bytes: bytes) -> list[list[str]]:
 
     except (
         requests.RequestException,
+        RuntimeError,
         ValueError,
         KeyError,
         json.JSONDecodeError,
@@ -216,14 +280,14 @@ def fix_detached_last_letter(text: str) -> str:
     if not text:
         return None
     # Pattern: Word(3+) + Space + Single Letter at end
-    return re.sub(r"([A-Za-z]{3,})\s+([A-Za-z]{0,4})$", r"\1\2", text)
+    return DETACHED_LETTER_RE.sub(r"\1\2", text)
 
 
 def clean_punctuation(text: str) -> str:
     if not text:
         return None
-    text = re.sub(r"\s*,[\s,]*", ", ", text)  # Merge commas
-    text = re.sub(r"\s+", " ", text)  # Merge spaces
+    text = COMMA_RE.sub(", ", text)  # Merge commas
+    text = WS_RE.sub(" ", text)  # Merge spaces
     return text.strip(" ,.-")
 
 
@@ -233,37 +297,35 @@ def normalize_records(row: list[str], index: int) -> dict[str, Any]:
     Dynamically maps non-empty row values to keys based on COLUMN_ORDER.
     """
     # 1. Compact: Remove None, empty strings
-    clean_values = [clean_text(val) for val in row if val and clean_text(val)]
+    clean_values = [val for val in map(clean_text, row) if val]
 
-    # 2. Map: Zip values to our fixed COLUMN_ORDER
+    # 2. Map: Unpack values in our fixed COLUMN_ORDER, padded with blanks
     # This automatically assigns the 1st valid text to "Hospital Name", 2nd to "Address_1", etc.
-    mapped_data = dict(zip(COLUMN_ORDER, clean_values))
+    # Unpacked straight into locals, no intermediate dict per row
+    name, address_1, address_2, state, city, location, pin_code = (
+        clean_values + BLANK_COLUMNS
+    )[: len(COLUMN_ORDER)]
 
     # 3. Construct Full Address
     addr_parts = []
-    if mapped_data.get("Address_1"):
-        addr_parts.append(mapped_data["Address_1"])
-    if mapped_data.get("Address_2") and not any(
-        mapped_data["Address_2"] in part for part in addr_parts
-    ):
-        addr_parts.append(mapped_data["Address_2"])
-    if mapped_data.get("Location") and not any(
-        mapped_data["Location"] in part for part in addr_parts
-    ):
-        addr_parts.append(mapped_data["Location"])
+    if address_1:
+        addr_parts.append(address_1)
+    if address_2 and not any(address_2 in part for part in addr_parts):
+        addr_parts.append(address_2)
+    if location and not any(location in part for part in addr_parts):
+        addr_parts.append(location)
     full_address = ", ".join(addr_parts)
 
     # 4. Fix City
-    raw_city = mapped_data.get("City", "")
-    clean_city = fix_detached_last_letter(raw_city)
+    clean_city = fix_detached_last_letter(city)
 
     # 5. Create Final Record
     final_record = {
-        "Hospital Name": mapped_data.get("Hospital Name", ""),
+        "Hospital Name": name,
         "Address": clean_punctuation(full_address),
         "City": clean_city,
-        "State": mapped_data.get("State", ""),
-        "Pin Code": mapped_data.get("Pin Code", ""),
+        "State": state,
+        "Pin Code": pin_code,
     }
 
     return cleanup_address_fields(final_record)
@@ -278,18 +340,21 @@ def cleanup_address_fields(record: dict[str, str]) -> dict[str, str]:
     if not addr:
         return record
 
-    def strip_suffix(text, suffix):
-        if suffix and text.upper().endswith(suffix.upper()):
-            return text[: -len(suffix)]
-        return text
-
+    suffixes = []
     if city:
-        addr = strip_suffix(addr, city)
+        suffixes.append(city)
         if len(city) > 4:
-            spaced_city = city[:-1] + " " + city[-1]
-            addr = strip_suffix(addr, spaced_city)
+            suffixes.append(city[:-1] + " " + city[-1])
     if state:
-        addr = strip_suffix(addr, state)
+        suffixes.append(state)
+
+    # Upper-case the address once, both copies are trimmed together
+    addr_upper = addr.upper()
+    for suffix in suffixes:
+        suffix_upper = suffix.upper()
+        if addr_upper.endswith(suffix_upper):
+            addr = addr[: -len(suffix)]
+            addr_upper = addr_upper[: -len(suffix_upper)]
 
     record["Address"] = clean_punctuation(addr)
     return record
@@ -305,10 +370,10 @@ def main():
     if target_url.lower().endswith(".pdf"):
         pdf_content = fetch_url_content(target_url)
     else:
-        html = fetch_url_content(target_url)
-        if html:
+        landing_page = fetch_url_content(target_url)
+        if landing_page:
             base = f"{urlparse(target_url).scheme}://{urlparse(target_url).netloc}"
-            pdf_link = find_pdf_link(base, html)
+            pdf_link = find_pdf_link(base, landing_page)
             if pdf_link:
                 pdf_content = fetch_url_content(pdf_link)
 
@@ -316,8 +381,15 @@ def main():
         logger.error("Could not obtain PDF content.")
         return
 
-    # 2. Extract (Now returns List[List])
-    raw_data = extract_raw_data_from_pdf(pdf_content)
+    # 2. Extract (Now returns List[List]), unless this exact PDF was parsed before
+    cache_path = utils.get_cache_path(CACHE_DIR, COMPANY, pdf_content, PARSER_VERSION)
+    raw_data = utils.load_parse_cache(cache_path)
+    if raw_data is not None:
+        logger.info(f"Unchanged PDF, loaded rows from {cache_path.name}")
+    else:
+        raw_data = extract_raw_data_from_pdf(pdf_content)
+        if raw_data:
+            utils.save_parse_cache(cache_path, COMPANY, raw_data)
     logger.info(f"Raw rows extracted: {len(raw_data)}")
     if len(raw_data) > 0:
         logger.info(f"Sample Raw List: {raw_data[0]}")
@@ -331,22 +403,22 @@ def main():
         # But in the raw list (with ghosts), Hospital Name is at index 0
         name_val = row[0] if row else ""
 
-        if name_val and clean_text(name_val):
+        if clean_text(name_val):
             # It's a new record
             last_row = row
             merged_data.append(last_row)
         elif last_row:
             # It's a fragment row (e.g. page break continuation).
             # We must merge it into last_row.
+            # --- Expand last_row once if fragment has columns beyond last_row's length ---
+            if len(last_row) < len(row):
+                last_row.extend([""] * (len(row) - len(last_row)))
+
             for i, val in enumerate(row):
                 val = clean_text(val)
                 if not val:
                     continue
 
-                # --- Auto-expand last_row if fragment has columns beyond last_row's length ---
-                while len(last_row) <= i:
-                    last_row.append("")
-
                 # Merge the text
                 current_val = last_row[i]
                 if current_val:
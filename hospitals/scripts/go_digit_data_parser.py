@@ -1,9 +1,8 @@
 import json
 import logging
-import re
 from pathlib import Path
-from typing import Any
 
+import pandas as pd
 from playwright.sync_api import sync_playwright
 
 # --- Configuration & Logging Setup ---
@@ -29,8 +28,61 @@ OUTPUT_FILENAME = DATA_DIR / (COMPANY + " Excluded_Hospitals_List.json")
 # Ensure data directory exists
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-# Resources we don't need to load to get the data
-BLOCKED_RESOURCES = ["image", "font", "media", "stylesheet", "other"]
+# Resources we don't need to load to get the data (images, fonts, media, styles).
+# Blocked by URL inside Chromium, so no request is routed through Python.
+# Anchored to the end of the path (or the start of a query string) so an API
+# call or page that merely contains ".css" somewhere in its URL still loads.
+BLOCKED_URL_PATTERNS = [
+    pattern
+    for ext in [
+        "png",
+        "jpg",
+        "jpeg",
+        "gif",
+        "svg",
+        "webp",
+        "ico",
+        "woff",
+        "woff2",
+        "ttf",
+        "otf",
+        "css",
+        "mp4",
+        "webm",
+    ]
+    for pattern in (f"*.{ext}", f"*.{ext}?*")
+]
+
+# Reads the rendered table rows; textContent is faster than innerText and
+# safe against CSS hiding. Returned column by column, so the field names
+# cross the CDP bridge once instead of once per row
+EXTRACT_ROWS_JS = """window.__extractRows = () => {
+    const rows = document.querySelectorAll('#hospitalTableBody tr');
+    const results = {
+        'Hospital Name': [],
+        'Address': [],
+        'City': [],
+        'State': [],
+        'Pin Code': [],
+        'Effective Date': []
+    };
+
+    rows.forEach(row => {
+        const cols = row.querySelectorAll('td');
+        if (cols.length >= 7) {
+            results['Hospital Name'].push(cols[1].textContent);
+            results['Address'].push(cols[2].textContent);
+            results['City'].push(cols[3].textContent);
+            results['State'].push(cols[4].textContent);
+            results['Pin Code'].push(cols[5].textContent);
+            results['Effective Date'].push(cols[6].textContent);
+        }
+    });
+    return results;
+};"""
+
+# Output fields, in the order the table columns are read
+FIELDS = ["Hospital Name", "Address", "City", "State", "Pin Code", "Effective Date"]
 
 
 def get_source_url(company_name: str, url_key: str) -> str:
@@ -59,15 +111,13 @@ def get_source_url(company_name: str, url_key: str) -> str:
     return url
 
 
-def clean_text(text: Any) -> str:
-    """Standardizes text: removes newlines, trims whitespace."""
-    if not text:
-        return ""
-    # Replace newlines/tabs with space and strip
-    return re.sub(r"\s+", " ", str(text)).strip()
+def clean_column(col: pd.Series) -> pd.Series:
+    """Standardizes a text column: removes newlines, trims whitespace."""
+    # Replace newlines/tabs with space and strip, split() does both in C
+    return col.fillna("").astype(str).str.split().str.join(" ")
 
 
-def scrape_godigit_hospitals(target_url) -> list[dict]:
+def scrape_godigit_hospitals(target_url) -> dict[str, list[str]]:
     """
     Uses Playwright with resource blocking and stealth args.
     """
@@ -80,51 +130,32 @@ def scrape_godigit_hospitals(target_url) -> list[dict]:
         context = browser.new_context(
             user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36"
         )
+        # Defined on every document before its own scripts run, so the extractor
+        # is parsed once per page load instead of being shipped with the call
+        context.add_init_script(EXTRACT_ROWS_JS)
         page = context.new_page()
 
-        # Prevents loading images/fonts
-        def route_intercept(route):
-            if route.request.resource_type in BLOCKED_RESOURCES:
-                route.abort()
-            else:
-                route.continue_()
-
-        page.route("**/*", route_intercept)
-
         try:
+            # Prevents loading images/fonts at the network layer
+            cdp = context.new_cdp_session(page)
+            cdp.send("Network.enable")
+            cdp.send("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+
             logger.info(f"Navigating to {target_url}")
-            # Wait until network is idle (no active connections for 500ms)
-            # or domcontentloaded to ensure the JS decryption logic has started.
-            page.goto(target_url, wait_until="domcontentloaded", timeout=60000)
+            # The table rows are awaited below, so navigation only needs to commit
+            page.goto(target_url, wait_until="commit", timeout=60000)
 
             logger.info("Waiting for table render...")
             # We wait for the first row to appear.
             # Once <tr> exists, the data is decrypted and rendered.
-            page.wait_for_selector("#hospitalTableBody tr", timeout=30000)
-            # Using 'textContent' instead of 'innerText' is faster and safer against CSS hiding.
+            # The page load now counts against this wait, hence the longer timeout.
+            page.wait_for_selector("#hospitalTableBody tr", timeout=60000)
             logger.info("Extracting data from DOM...")
-            raw_data = page.evaluate("""() => {
-                const rows = document.querySelectorAll('#hospitalTableBody tr');
-                const results = [];
-                
-                rows.forEach(row => {
-                    const cols = row.querySelectorAll('td');
-                    if (cols.length >= 7) {
-                        results.push({
-                            'Hospital Name': cols[1].textContent,
-                            'Address': cols[2].textContent,
-                            'City': cols[3].textContent,
-                            'State': cols[4].textContent,
-                            'Pin Code': cols[5].textContent,
-                            'Effective Date': cols[6].textContent
-                        });
-                    }
-                });
-                return results;
-            }""")
-
-            logger.info(f"Extracted {len(raw_data)} rows.")
-            return raw_data
+            raw_data = page.evaluate("() => window.__extractRows()")
+
+            row_count = len(raw_data["Hospital Name"])
+            logger.info(f"Extracted {row_count} rows.")
+            return raw_data if row_count else {}
 
         except (
             OSError,
@@ -135,29 +166,24 @@ def scrape_godigit_hospitals(target_url) -> list[dict]:
             json.JSONDecodeError,
         ) as e:
             logger.error(f"Error during scraping: {e}")
-            return []
+            return {}
         finally:
+            page.close()
+            context.close()
             browser.close()
 
 
-def transform_data(raw_data: list[dict]) -> list[dict]:
-    """Cleans and standardizes the scraped data."""
-    standardized_list = []
-
-    for item in raw_data:
-        record = {
-            "Hospital Name": clean_text(item.get("Hospital Name")),
-            "Address": clean_text(item.get("Address")),
-            "City": clean_text(item.get("City")),
-            "State": clean_text(item.get("State")),
-            "Pin Code": clean_text(item.get("Pin Code")),
-            "Effective Date": clean_text(item.get("Effective Date")),
-        }
+def transform_data(raw_data: dict[str, list[str]]) -> list[dict]:
+    """Cleans and standardizes the scraped columns."""
+    if not raw_data:
+        return []
 
-        if record["Hospital Name"]:
-            standardized_list.append(record)
+    # Built straight from the columns, no row-to-column transpose
+    df = pd.DataFrame(raw_data, columns=FIELDS).apply(clean_column)
 
-    return standardized_list
+    # Drop records without a name
+    df = df[df["Hospital Name"] != ""]
+    return df.to_dict("records")
 
 
 def main():
@@ -1,15 +1,18 @@
-import io
 import json
 import logging
+import os
 import re
+import sys
 from pathlib import Path
 from typing import Any
 from urllib.parse import urljoin, urlparse
 
-import pdfplumber
+import pymupdf
 import requests
-from bs4 import BeautifulSoup
+import utils
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
+from selectolax.lexbor import LexborHTMLParser
 
 # --- Configuration & Logging Setup ---
 logging.basicConfig(
@@ -43,6 +46,16 @@ HEADERS_UA = {
     )
 }
 
+# pdfplumber's default ruled-table settings
+TABLE_SETTINGS = {
+    "vertical_strategy": "lines",
+    "horizontal_strategy": "lines",
+    "snap_tolerance": 3,
+}
+
+# First-row cells that mark a header repeated on a later page
+REPEATED_HEADER_CELLS = frozenset(["SR. NO.", "PROVIDER NAME", "HOSPITAL NAME"])
+
 # --- Header Normalization Map ---
 # Standardized Names for Values to extract found in PDFs (case-insensitive).
 HEADER_ALIASES = {
@@ -92,6 +105,75 @@ HEADER_ALIASES = {
     ],
 }
 
+# Fields normalize_records searches for misplaced data, in priority order
+SOUP_KEYS = ("Address", "City", "State", "Pin Code", "Effective Date", "Overflow_Text")
+
+# --- Precompiled Patterns ---
+NON_ALNUM_RE = re.compile(r"[^A-Z0-9]")
+WS_RE = re.compile(r"\s+")
+DATE_RE = re.compile(r"\d{1,2}[-/]\d{1,2}[-/]\d{4}")
+PIN_RE = re.compile(r"\d{6}")
+FUSED_PIN_RE = re.compile(r"(\d{6})([A-Za-z])")  # e.g. 110001Delhi
+PIN_SEPARATORS = "-, \t\n\r\f\v"  # Stripped before a scrubbed pin
+# Indian suffixes often split by OCR spaces: RAM, REDDY, PATNAM, ANAM, GARH, PUR, BAD, NAGAR, PET
+SPLIT_SUFFIX_RE = re.compile(
+    r"([A-Za-z]{3,})\s+((?:RAM|REDDY|PATNAM|ANAM|GARH|PUR|BAD|NAGAR|PETA?))$",
+    re.IGNORECASE,
+)
+SPLIT_TAIL_RE = re.compile(r"([A-Za-z]{3,})\s+([A-Za-z]{1,4})$", re.IGNORECASE)
+COMMA_RUN_RE = re.compile(r"\s*,[\s,]*")
+REPEATED_WORD_RE = re.compile(r"\b(\w{4,})\b(?=.*\b\1\b)", re.IGNORECASE)
+EMPTY_PARENS_RE = re.compile(r"\( \)")
+# Abbreviations of a state that may end an address
+STATE_ABBREVIATIONS = {
+    "UTTAR PRADESH": ["U.P.", "UP", "U.P"],
+    "WEST BENGAL": ["W.B.", "WB", "W.B"],
+    "MADHYA PRADESH": ["M.P.", "MP", "M.P"],
+    "MAHARASHTRA": ["MAH", "MH."],
+}
+# Other names of a city that may end an address
+CITY_ALIASES = {
+    "GURUGRAM": ["GURGAON"],
+    "BENGALURU": ["BANGALORE"],
+    "MUMBAI": ["BOMBAY"],
+    "KOLKATA": ["CALCUTTA"],
+    "CHENNAI": ["MADRAS"],
+    "VARANASI": ["BANARAS"],
+    "TRIVANDRUM": ["THIRUVANANTHAPURAM"],
+    "COIMBATORE": ["KOVAI"],
+    "THANE": ["THANA"],
+    "DELHI": ["NCR", "NEW DELHI", "DELHI"],
+    "NAVI MUMBAI": ["NAVI-MUMBAI"],
+}
+# Words left dangling at the end of an address once city/state are stripped
+DANGLING_WORDS = [
+    "NEW",
+    "OLD",
+    "GREATER",
+    "NAVI",
+    "UPPER",
+    "LOWER",
+    "DIST",
+    "DISTRICT",
+    "NEAR",
+    "BEHIND",
+    "NR",
+]
+# One or more dangling words at the end, each a whole word after a space (or the
+# whole address), with the punctuation between them
+DANGLING_TAIL_RE = re.compile(
+    r"(?:(?:^|\s)(?:" + "|".join(DANGLING_WORDS) + r")[\s,.\-]*)+$", re.IGNORECASE
+)
+
+# Normalized alias -> standard key ("PROVIDERNAME" -> "Hospital Name"), built once.
+# Reversed so the first standard key listing an alias wins, as in a top-down scan.
+# 'SNO', 'SRNO', 'SLNO' and 'SR' are covered by the Sr. No. aliases.
+ALIAS_TO_STANDARD = {
+    NON_ALNUM_RE.sub("", alias.upper()): standard_key
+    for standard_key, aliases in reversed(HEADER_ALIASES.items())
+    for alias in aliases
+}
+
 
 def clean_text(text: Any) -> str:
     """Standardizes text: removes newlines, trims whitespace, handles None."""
@@ -111,19 +193,12 @@ def get_standard_header_name(raw_header: str) -> str:
         return "Extra_Col"
 
     # Normalize input: "Provider_Name" -> "PROVIDERNAME"
-    clean_input = re.sub(r"[^A-Z0-9]", "", str(raw_header).upper())
+    clean_input = NON_ALNUM_RE.sub("", str(raw_header).upper())
 
     # Check against normalized aliases
-    for standard_key, aliases in HEADER_ALIASES.items():
-        # Normalize alias list: ["PROVIDER NAME"] -> ["PROVIDERNAME"]
-        norm_aliases = [re.sub(r"[^A-Z0-9]", "", a.upper()) for a in aliases]
-
-        if clean_input in norm_aliases:
-            return standard_key
-
-    # Special Case: 'SNO' often appears for Sr. No.
-    if clean_input in ["SNO", "SRNO", "SLNO", "SR.", "SR"]:
-        return "Sr. No."
+    standard_key = ALIAS_TO_STANDARD.get(clean_input)
+    if standard_key:
+        return standard_key
 
     # Fallback
     clean_header = clean_text(raw_header).upper().strip()
@@ -156,10 +231,20 @@ def get_source_url(company_name: str, url_key: str) -> str:
     return url
 
 
-def fetch_url_content(url: str) -> bytes | None:
+def get_session() -> requests.Session:
+    """Creates a session so the landing page and PDF share one keep-alive connection."""
+    session = requests.Session()
+    session.headers.update(HEADERS_UA)
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def fetch_url_content(session: requests.Session, url: str) -> bytes | None:
     try:
         logger.info(f"Fetching URL: {url}")
-        response = requests.get(url, headers=HEADERS_UA, timeout=30)
+        response = session.get(url, timeout=30)
         response.raise_for_status()
         return response.content
     except RequestException as e:
@@ -171,22 +256,25 @@ def find_pdf_link(
     base_url: str, html_content: bytes, search_keyword: str = "exclude"
 ) -> str | None:
     try:
-        soup = BeautifulSoup(html_content, "html.parser")
-
-        # 1. Search by Text
-        link_tag = soup.find(
-            "a", string=lambda text: text and search_keyword in text.lower()
-        )
-
-        # 2. Search by Href
-        if not link_tag:
+        keyword = search_keyword.lower()
+        relative_url = None
+        href_match = None
+
+        # One C-level parse, then a single walk over the links:
+        # 1. Search by Text, the first match wins and ends the walk
+        # 2. Search by Href, the first match is kept as the fallback
+        for a in LexborHTMLParser(html_content).css("a[href]"):
+            href = a.attributes["href"]
+            if keyword in a.text().lower():
+                relative_url = href
+                break
+            if href_match is None and keyword in (href or "").lower():
+                href_match = href
+        else:
             logger.info("Keyword not found in text, checking hrefs...")
-            link_tag = soup.find(
-                "a", href=lambda href: href and search_keyword in href.lower()
-            )
+            relative_url = href_match
 
-        if link_tag and link_tag.get("href"):
-            relative_url = link_tag.get("href")
+        if relative_url:
             # Handle full URLs vs relative URLs
             if relative_url.startswith("http"):
                 return relative_url
@@ -206,6 +294,24 @@ def find_pdf_link(
         return None
 
 
+def extract_table_pymupdf(page: pymupdf.Page) -> list[list[str | None]] | None:
+    """Returns the rows of the largest ruled table on a page, like pdfplumber did."""
+    finder = page.find_tables(**TABLE_SETTINGS)
+    tables = finder.tables
+    if not tables:
+        return None
+    largest = min(tables, key=lambda t: (-len(t.cells), t.bbox[1], t.bbox[0]))
+    # Words come from the text page find_tables already built, so the page
+    # text is read once and each cell then only checks nearby tiles
+    grid = utils.bucket_words(page.get_text("words", textpage=finder.textpage))
+    return utils.extract_rows(largest, grid)
+
+
+def extract_one_page(page_index: int) -> list[list[str | None]] | None:
+    """Extracts the main table of one page inside a worker process."""
+    return extract_table_pymupdf(utils.worker_pdf[page_index])
+
+
 def extract_raw_data_from_pdf(pdf_bytes: bytes) -> list[dict[str, Any]]:
     """
     Extracts data using dynamic header mapping.
@@ -214,11 +320,17 @@ def extract_raw_data_from_pdf(pdf_bytes: bytes) -> list[dict[str, Any]]:
     headers = []
 
     try:
-        with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-            logger.info(f"Processing PDF with {len(pdf.pages)} pages...")
-
-            for i, page in enumerate(pdf.pages):
-                table = page.extract_table()
+        with pymupdf.open(stream=pdf_bytes, filetype="pdf") as pdf:
+            page_count = pdf.page_count
+        logger.info(f"Processing PDF with {page_count} pages...")
+
+        # Pages are extracted in parallel, headers and rows are still
+        # assembled in page order below
+        workers = max(1, min(os.cpu_count() or 1, page_count))
+        with utils.MP_CONTEXT.Pool(
+            workers, utils.init_pdf_worker, (pdf_bytes,)
+        ) as pool:
+            for i, table in enumerate(pool.imap(extract_one_page, range(page_count))):
                 if not table:
                     continue
 
@@ -232,18 +344,17 @@ def extract_raw_data_from_pdf(pdf_bytes: bytes) -> list[dict[str, Any]]:
                         # Handle duplicate headers or empty ones by appending index
                         if std_name in headers or not std_name:
                             std_name = f"{std_name}_{len(headers)}"
-                        headers.append(std_name)
+                        # Interned, so every row dict shares one key object
+                        headers.append(sys.intern(std_name))
 
                     logger.info(f"Detected Standardized Headers: {headers}")
                     data = table[1:]
                 else:
                     # Skip repeated header rows on subsequent pages
                     # We check if the current row 0 matches our detected headers (loosely)
-                    current_first_row_raw = [clean_text(x) for x in table[0]]
                     # A simplistic check: if "Sr. No." or "Hospital Name" is in the first row
                     if any(
-                        x.upper() in ["SR. NO.", "PROVIDER NAME", "HOSPITAL NAME"]
-                        for x in current_first_row_raw
+                        clean_text(x).upper() in REPEATED_HEADER_CELLS for x in table[0]
                     ):
                         data = table[1:]
                     else:
@@ -251,28 +362,33 @@ def extract_raw_data_from_pdf(pdf_bytes: bytes) -> list[dict[str, Any]]:
 
                 # --- Row Extraction ---
                 print(data[0])
+                # Handle rows that have more columns than headers (overflow)
+                # We add 'Extra_Col_X' keys for them so data isn't lost, built
+                # once for the widest row of the page instead of per row
+                width = len(headers)
+                max_len = max((len(row) for row in data), default=width)
+                page_headers = headers + [
+                    sys.intern(f"Extra_Col_{x}") for x in range(max_len - width)
+                ]
                 for row in data:
-                    if not any(row):  # Skip completely empty rows
+                    # Skip completely empty rows, any() short-circuits in C
+                    # on the first non-empty cell (None and "" are both falsy)
+                    if not any(row):
                         continue
 
-                    # Handle rows that have more columns than headers (overflow)
-                    # We add 'Extra_Col_X' keys for them so data isn't lost
-                    current_headers = headers.copy()
-                    if len(row) > len(headers):
-                        for x in range(len(row) - len(headers)):
-                            current_headers.append(f"Extra_Col_{x}")
-
                     # Handle rows with fewer columns (pad with None)
-                    row_data = row + [None] * (len(current_headers) - len(row))
+                    if len(row) < width:
+                        row = row + [None] * (width - len(row))
 
-                    # Zip headers with data
-                    item = dict(zip(current_headers, row_data))
+                    # Zip headers with data, zip stops at the row's own width
+                    item = dict(zip(page_headers, row))
                     all_rows.append(item)
 
         return all_rows
 
     except (
         requests.RequestException,
+        RuntimeError,
         ValueError,
         KeyError,
         json.JSONDecodeError,
@@ -316,20 +432,28 @@ def merge_fragmented_rows(raw_data: list[dict[str, Any]]) -> list[dict[str, Any]
                 fragment_text = []
                 # Collect text from all columns except identifier ones
                 for key, val in row.items():
-                    if val and key not in ["Sr. No.", "Hospital Name"]:
+                    if val and key not in ("Sr. No.", "Hospital Name"):
                         fragment_text.append(clean_text(val))
 
                 # Append fragment text to a specific bucket in the parent row
-                # We use a special key 'Overflow_Text' to store this soup
+                # We use a special key 'Overflow_Text' to store this soup,
+                # collected as a list and joined once below
                 if fragment_text:
-                    existing = last_valid_row.get("Overflow_Text", "")
-                    last_valid_row["Overflow_Text"] = (
-                        existing + " " + " ".join(fragment_text)
-                    )
+                    last_valid_row.setdefault("Overflow_Text", []).extend(fragment_text)
+
+    for row in merged_data:
+        if "Overflow_Text" in row:
+            # Leading space kept as before, a blank fragment still marks the row
+            row["Overflow_Text"] = " " + " ".join(row["Overflow_Text"])
 
     return merged_data
 
 
+def is_ascii_alpha(text: str) -> bool:
+    """True for non-empty text made only of A-Z/a-z."""
+    return text.isascii() and text.isalpha()
+
+
 def fix_detached_last_letter(text: str) -> str:
     """
     Fixes city names like 'AHMEDABA D' -> 'AHMEDABAD' or 'KARIMNAGA R' -> 'KARIMNAGAR'.
@@ -338,8 +462,14 @@ def fix_detached_last_letter(text: str) -> str:
     if not text:
         return None
     # Pattern: Word (3+ chars) + Space + Single Letter (End of string)
-    # e.g. "NAGA R" -> "NAGAR"
-    return re.sub(r"([A-Za-z]{3,})\s+([A-Za-z])$", r"\1\2", text)
+    # e.g. "NAGA R" -> "NAGAR", checked with plain string ops on the tail only
+    tail = text[-1]
+    if len(text) < 5 or not text[-2].isspace() or not is_ascii_alpha(tail):
+        return text
+    head = text[:-1].rstrip()
+    if len(head) >= 3 and is_ascii_alpha(head[-3:]):
+        return head + tail
+    return text
 
 
 def fix_broken_city_names(text: str) -> str:
@@ -355,17 +485,11 @@ def fix_broken_city_names(text: str) -> str:
     text = text.strip()
 
     # 1. Merge specific Indian suffixes often split by OCR spaces
-    # Matches: RAM, REDDY, PATNAM, ANAM, GARH, PUR, BAD, NAGAR, PET
-    suffixes = r"(?:RAM|REDDY|PATNAM|ANAM|GARH|PUR|BAD|NAGAR|PETA?)"
-    text = re.sub(
-        r"([A-Za-z]{3,})\s+(" + suffixes + r")$", r"\1\2", text, flags=re.IGNORECASE
-    )
+    text = SPLIT_SUFFIX_RE.sub(r"\1\2", text)
 
     # 2. Merge "Word + 1-4 letters" at the end of the string
     # We ensure the first part is at least 3 chars to avoid merging valid separate words like "NEW UK"
-    text = re.sub(
-        r"([A-Za-z]{3,})\s+([A-Za-z]{1,4})$", r"\1\2", text, flags=re.IGNORECASE
-    )
+    text = SPLIT_TAIL_RE.sub(r"\1\2", text)
 
     return text
 
@@ -377,54 +501,52 @@ def clean_punctuation(text: str) -> str:
     if not text:
         return None
     # 1. Replace multiple commas/spaces (e.g. ", ," or ",,") with a single comma
-    text = re.sub(r"\s*,[\s,]*", ", ", text)
+    text = COMMA_RUN_RE.sub(", ", text)
     # 2. Remove repeated words (4+ letters) appearing anywhere in the line
-    text = re.sub(r"\b(\w{4,})\b(?=.*\b\1\b)", "", text, flags=re.IGNORECASE)
+    text = REPEATED_WORD_RE.sub("", text)
     # 3. Remove double spaces
-    text = re.sub(r"\s+", " ", text)
+    text = WS_RE.sub(" ", text)
     # 4. Remove empty parentheses
-    text = re.sub(r"\( \)", "", text)
+    text = EMPTY_PARENS_RE.sub("", text)
     # 5. Strip leading/trailing punctuation
     return text.strip(" ,.-")
 
 
+def scrub_pin(text: str, pin: str) -> str:
+    """
+    Replaces every pin and the separators before it with a space. Plain
+    string ops, every record has its own pin so a regex would be compiled
+    per record.
+    """
+    parts = text.split(pin)
+    return " ".join([part.rstrip(PIN_SEPARATORS) for part in parts[:-1]] + parts[-1:])
+
+
 def normalize_records(record: dict[str, Any]) -> dict[str, Any]:
     """
     Cleans up the record by searching all available text fields for
     misplaced Dates or Pin Codes.
     """
-    # 1. Regex Patterns
-    date_pattern = re.compile(r"\d{1,2}[-/]\d{1,2}[-/]\d{4}")
-    pin_pattern = re.compile(r"\d{6}")
-    fused_pin_pattern = re.compile(r"(\d{6})([A-Za-z])")  # e.g. 110001Delhi
-
-    # 2. Gather all text content into a 'Soup'
+    # 1. Gather all text content into a 'Soup'
     # We look at standard keys + any extra/overflow keys created during extraction/merging
     values_soup = []
 
-    # Priority fields to check for misplaced data
-    keys_to_check = [
-        "Address",
-        "City",
-        "State",
-        "Pin Code",
-        "Effective Date",
-        "Overflow_Text",
+    # Priority fields, then any dynamically created extra columns
+    values = [
+        *map(record.get, SOUP_KEYS),
+        *(val for key, val in record.items() if key.startswith("Extra_Col")),
     ]
-    # Add any dynamically created extra columns
-    keys_to_check += [k for k in record if k.startswith("Extra_Col")]
 
-    for key in keys_to_check:
-        val = record.get(key)
+    for val in values:
         if val:
             clean_val = clean_text(val)
             # Fix fused pins
-            clean_val = fused_pin_pattern.sub(r"\1 \2", clean_val)
+            clean_val = FUSED_PIN_RE.sub(r"\1 \2", clean_val)
             # Remove double spaces
-            clean_val = re.sub(r"\s+", " ", clean_val)
+            clean_val = WS_RE.sub(" ", clean_val)
             values_soup.append(clean_val)
 
-    # 3. Init Final Record
+    # 2. Init Final Record
     final_record = {
         "Hospital Name": clean_text(record.get("Hospital Name")),
         "Address": None,
@@ -434,11 +556,11 @@ def normalize_records(record: dict[str, Any]) -> dict[str, Any]:
         "Effective Date": None,
     }
 
-    # 4. Extract Specific Types (Date, Pin) from the Soup
+    # 3. Extract Specific Types (Date, Pin) from the Soup
 
     # FIND DATE (Search backwards)
     for i in range(len(values_soup) - 1, -1, -1):
-        match = date_pattern.search(values_soup[i])
+        match = DATE_RE.search(values_soup[i])
         if match:
             final_record["Effective Date"] = match.group(0)
             # Remove date from soup so it doesn't end up in address
@@ -449,7 +571,7 @@ def normalize_records(record: dict[str, Any]) -> dict[str, Any]:
 
     # FIND PIN (Search backwards)
     for i in range(len(values_soup) - 1, -1, -1):
-        match = pin_pattern.search(values_soup[i])
+        match = PIN_RE.search(values_soup[i])
         if match:
             final_record["Pin Code"] = match.group(0)
             values_soup[i] = values_soup[i].replace(match.group(0), "").strip()
@@ -457,7 +579,7 @@ def normalize_records(record: dict[str, Any]) -> dict[str, Any]:
                 values_soup.pop(i)
             break
 
-    # --- 5. HEURISTIC ASSIGNMENT ---
+    # --- 4. HEURISTIC ASSIGNMENT ---
     # Apply fix_detached_last_letter immediately when popping values
     if values_soup:
         raw_state = values_soup.pop(-1)
@@ -480,7 +602,7 @@ def normalize_records(record: dict[str, Any]) -> dict[str, Any]:
         # Scrub Pin Code
         if final_record["Pin Code"]:
             # Remove "800008" or "-800008" or "- 800008"
-            addr = re.sub(r"[-,\s]*" + final_record["Pin Code"], " ", addr)
+            addr = scrub_pin(addr, final_record["Pin Code"])
 
         # Scrub State
         if final_record["State"]:
@@ -492,10 +614,18 @@ def normalize_records(record: dict[str, Any]) -> dict[str, Any]:
 
         final_record["Address"] = addr
 
-    # 6. Redundancy Cleanup (Dangling words, repeated City names)
+    # 5. Redundancy Cleanup (Dangling words, repeated City names)
     return cleanup_address_fields(final_record)
 
 
+def strip_suffix(text: str, text_upper: str, suffix: str) -> tuple[str, str]:
+    """Case-insensitive suffix strip on a text and its upper-cased copy."""
+    suffix_upper = suffix.upper()
+    if suffix and text_upper.endswith(suffix_upper):
+        return text[: -len(suffix)], text_upper[: -len(suffix_upper)]
+    return text, text_upper
+
+
 def cleanup_address_fields(record: dict[str, str]) -> dict[str, str]:
     """
     Removes redundant city/state names from the address field.
@@ -507,30 +637,20 @@ def cleanup_address_fields(record: dict[str, str]) -> dict[str, str]:
     if not addr:
         return record
 
-    # Helper: Case-insensitive suffix strip
-    def strip_suffix(text, suffix):
-        if suffix and text.upper().endswith(suffix.upper()):
-            return text[: -len(suffix)]
-        return text
+    # Upper-cased once, then trimmed in step with the address
+    addr_upper = addr.upper()
 
     # --- A. CLEAN STATE ---
     if state:
-        addr = strip_suffix(addr, state)
+        addr, addr_upper = strip_suffix(addr, addr_upper, state)
         # Abbreviations
-        abbrevs = {
-            "UTTAR PRADESH": ["U.P.", "UP", "U.P"],
-            "WEST BENGAL": ["W.B.", "WB", "W.B"],
-            "MADHYA PRADESH": ["M.P.", "MP", "M.P"],
-            "MAHARASHTRA": ["MAH", "MH."],
-        }
-        if state.upper() in abbrevs:
-            for abbr in abbrevs[state.upper()]:
-                addr = strip_suffix(addr, abbr)
+        for abbr in STATE_ABBREVIATIONS.get(state.upper(), []):
+            addr, addr_upper = strip_suffix(addr, addr_upper, abbr)
 
     # --- B. CLEAN CITY (Ghost Suffix Fix) ---
     if city:
         # 1. Standard Strip
-        addr = strip_suffix(addr, city)
+        addr, addr_upper = strip_suffix(addr, addr_upper, city)
 
         # 2. Fix "DARBHANGADARBHANG A" -> Strip "DARBHANG A" if City is "DARBHANGA"
         # We try to detect if the end of the address LOOKS like the city
@@ -538,73 +658,28 @@ def cleanup_address_fields(record: dict[str, str]) -> dict[str, str]:
         # Create a "spaced" version of city (e.g. "DARBHANG A")
         if len(city) > 4:
             spaced_city = city[:-1] + " " + city[-1]
-            addr = strip_suffix(addr, spaced_city)
+            addr, addr_upper = strip_suffix(addr, addr_upper, spaced_city)
             spaced_city = city[:-2] + " " + city[-2]
-            addr = strip_suffix(addr, spaced_city)
+            addr, addr_upper = strip_suffix(addr, addr_upper, spaced_city)
             spaced_city = city[:-3] + " " + city[-3]
-            addr = strip_suffix(addr, spaced_city)
-        if addr.upper().endswith(city.upper()):
-            addr = addr[: -len(city)]
+            addr, addr_upper = strip_suffix(addr, addr_upper, spaced_city)
+        addr, addr_upper = strip_suffix(addr, addr_upper, city)
 
         # 3. Aliases
-        aliases = {
-            "GURUGRAM": ["GURGAON"],
-            "BENGALURU": ["BANGALORE"],
-            "MUMBAI": ["BOMBAY"],
-            "KOLKATA": ["CALCUTTA"],
-            "CHENNAI": ["MADRAS"],
-            "VARANASI": ["BANARAS"],
-            "TRIVANDRUM": ["THIRUVANANTHAPURAM"],
-            "COIMBATORE": ["KOVAI"],
-            "THANE": ["THANA"],
-            "DELHI": ["NCR", "NEW DELHI", "DELHI"],
-            "NAVI MUMBAI": ["NAVI-MUMBAI"],
-        }
-        if city.upper() in aliases:
-            for alias in aliases[city.upper()]:
-                addr = strip_suffix(addr, alias)
+        for alias in CITY_ALIASES.get(city.upper(), []):
+            addr, addr_upper = strip_suffix(addr, addr_upper, alias)
 
         # 4. Check for concatenated duplicate (e.g. "ROADCOIMBATORE")
-        if addr.upper().endswith(city.upper()):
-            addr = addr[: -len(city)]
+        addr, addr_upper = strip_suffix(addr, addr_upper, city)
 
     # --- C. RECURSIVE DANGLING WORD CLEANUP ---
-    dangling_words = [
-        "NEW",
-        "OLD",
-        "GREATER",
-        "NAVI",
-        "UPPER",
-        "LOWER",
-        "DIST",
-        "DISTRICT",
-        "NEAR",
-        "BEHIND",
-        "NR",
-    ]
-
-    # Pre-clean punctuation before loop
+    # Pre-clean punctuation, then drop the whole run of trailing dangling
+    # words (e.g. "..., NEAR NEW") in one substitution
     addr = clean_punctuation(addr)
-
-    dirty = True
-    while dirty:
-        dirty = False
-        if addr:
-            addr_upper = addr.upper()
-
-            for word in dangling_words:
-                # Check suffix " WORD"
-                if addr_upper.endswith(" " + word):
-                    addr = addr[: -(len(word) + 1)]
-                    addr = clean_punctuation(addr)  # Clean comma immediately
-                    dirty = True  # Run loop again to check for next word
-                    break
-
-                # Check exact match
-                elif addr_upper == word:
-                    addr = ""
-                    dirty = True
-                    break
+    if addr:
+        addr, stripped = DANGLING_TAIL_RE.subn("", addr)
+        if stripped and addr:
+            addr = clean_punctuation(addr)  # Clean comma left behind
 
     record["Address"] = addr
     return record
@@ -616,21 +691,22 @@ def get_excluded_hospitals_data():
         logger.error(f"No excluded_url found for {COMPANY} in sources.json")
         return
 
-    # 1. Fetch Landing Page
-    html_content = fetch_url_content(target_url)
-    if not html_content:
-        return
-
-    # 2. Find PDF Link
-    base_url = f"{urlparse(target_url).scheme}://{urlparse(target_url).netloc}"
-    pdf_url = find_pdf_link(base_url, html_content, search_keyword="exclude")
-    if not pdf_url:
-        return
-
-    # 3. Download PDF
-    pdf_content = fetch_url_content(pdf_url)
-    if not pdf_content:
-        return
+    with get_session() as session:
+        # 1. Fetch Landing Page
+        html_content = fetch_url_content(session, target_url)
+        if not html_content:
+            return
+
+        # 2. Find PDF Link
+        base_url = f"{urlparse(target_url).scheme}://{urlparse(target_url).netloc}"
+        pdf_url = find_pdf_link(base_url, html_content, search_keyword="exclude")
+        if not pdf_url:
+            return
+
+        # 3. Download PDF
+        pdf_content = fetch_url_content(session, pdf_url)
+        if not pdf_content:
+            return
 
     # 4. Extract (with Dynamic Headers)
     raw_data = extract_raw_data_from_pdf(pdf_content)
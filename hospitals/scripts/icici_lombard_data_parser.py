@@ -1,13 +1,20 @@
+import html
 import json
 import logging
 import math
+import re
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import Any
 
+import orjson
 import requests
-from bs4 import BeautifulSoup
 from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser
 from urllib3.util.retry import Retry
 
 # --- Configuration & Logging Setup ---
@@ -40,6 +47,35 @@ HEADERS = {
     "Referer": "https://ilhc.icicilombard.com/Customer/GetDelistedHospitalList",
 }
 RECORDS_PER_PAGE = 10  # From JS: recordsperpage: 10
+MAX_WORKERS = 8  # Cities searched in parallel
+PAGE_WORKERS = 4  # Result pages of a city fetched in parallel, under the pool size
+MAX_REQUESTS_PER_SEC = 10  # Across all workers, averaged over RATE_WINDOW requests
+RATE_WINDOW = 20
+PARTIAL_MAX_AGE = 24 * 3600  # Seconds a checkpoint of an interrupted run is kept
+
+# Output keys of the table columns 1 to 6, column 0 is the serial number
+OUT_KEYS = ("Hospital Name", "Address", "State", "City", "Pin Code", "Effective Date")
+
+# The dropdowns are flat <select> blocks, read with a regex instead of a DOM
+STATE_SELECT_RE = re.compile(
+    r"""<select[^>]*\bid=["']?ddlStateList\b[^>]*>(.*?)</select>""",
+    re.DOTALL | re.IGNORECASE,
+)
+CITY_SELECT_RE = re.compile(
+    r"""<select[^>]*\bid=["']?ddlCityList\b[^>]*>(.*?)</select>""",
+    re.DOTALL | re.IGNORECASE,
+)
+# Text up to the next tag, so an omitted </option> is handled too
+OPTION_RE = re.compile(r"<option[^>]*>([^<]*)", re.IGNORECASE)
+
+# The search context lives in the session cookies, so every worker thread
+# gets its own session instead of sharing one
+worker_state = threading.local()
+worker_sessions = []
+
+# Start times of the last RATE_WINDOW requests, shared by all workers
+request_times = deque(maxlen=RATE_WINDOW)
+rate_lock = threading.Lock()
 
 
 # --- Network Helpers ---
@@ -53,7 +89,33 @@ def get_session() -> requests.Session:
         status_forcelist=[500, 502, 503, 504],
         allowed_methods=["HEAD", "GET", "POST"],
     )
-    session.mount("https://", HTTPAdapter(max_retries=retries))
+    # One host, and at most PAGE_WORKERS requests in flight on a session, so
+    # every page fetch reuses a kept-alive connection
+    adapter = HTTPAdapter(
+        pool_connections=1, pool_maxsize=PAGE_WORKERS, max_retries=retries
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+def throttle() -> None:
+    """Waits only if the recent requests went out faster than the rate limit."""
+    with rate_lock:
+        if len(request_times) == RATE_WINDOW:
+            wait = RATE_WINDOW / MAX_REQUESTS_PER_SEC - (
+                time.monotonic() - request_times[0]
+            )
+            if wait > 0:
+                time.sleep(wait)
+        request_times.append(time.monotonic())
+
+
+def get_worker_session() -> requests.Session:
+    """Returns the session of the current worker thread, creating it once."""
+    session = getattr(worker_state, "session", None)
+    if session is None:
+        session = worker_state.session = get_session()
+        worker_sessions.append(session)
     return session
 
 
@@ -65,57 +127,69 @@ def clean_text(text: Any) -> str:
 
 
 # --- Parsing Helpers ---
-def parse_hospital_table(soup: BeautifulSoup) -> list[dict[str, str]]:
-    """Extracts hospital rows from the HTML soup."""
-    table = soup.find("table", {"id": "mt"})
-    if not table:
-        return []
+def is_header_row(values: list[str]) -> bool:
+    """True for the column titles row, no hospital has a State/City like these."""
+    state, city = values[2].lower(), values[3].lower()
+    return state.startswith("state") and city.startswith("city")
 
+
+def parse_hospital_table(tree: LexborHTMLParser) -> list[dict[str, str]]:
+    """Extracts hospital rows from the parsed HTML page."""
     hospitals = []
-    # logic to handle table body rows
-    tbody = table.find("tbody")
-    rows = tbody.find_all("tr", recursive=False) if tbody else table.find_all("tr")[1:]
+    # lexbor always wraps body rows in a tbody, and without a <thead> in the
+    # page the header row lands there too. A header of <th> cells is dropped
+    # by the column count check, one of <td> cells by its column titles.
+    # One query for the rows, a missing table simply yields none
+    rows = tree.css("table#mt > tbody > tr")
 
     for row in rows:
-        cols = row.find_all("td")
+        # Direct children only, walked without compiling a selector per row
+        cols = [node for node in row.iter() if node.tag == "td"]
         if len(cols) < 7:
             continue
 
         # Mapping based on HTML structure
-        record = {
-            "Hospital Name": clean_text(cols[1].get_text()),
-            "Address": clean_text(cols[2].get_text()),
-            "State": clean_text(cols[3].get_text()),
-            "City": clean_text(cols[4].get_text()),
-            "Pin Code": clean_text(cols[5].get_text()),
-            "Effective Date": clean_text(cols[6].get_text()),
-        }
-
-        if record["Hospital Name"]:
-            hospitals.append(record)
+        values = [clean_text(col.text()) for col in cols[1:7]]
+        if is_header_row(values):
+            continue
+        if values[0]:
+            hospitals.append(dict(zip(OUT_KEYS, values)))
 
     return hospitals
 
 
+def parse_dropdown(
+    page_html: str, select_re: re.Pattern, selector: str, placeholder: str
+) -> list[str] | None:
+    """Returns the option texts of a dropdown, None if it is missing."""
+    if match := select_re.search(page_html):
+        options = [
+            html.unescape(option).strip() for option in OPTION_RE.findall(match[1])
+        ]
+    else:
+        # Unexpected markup, fall back to the HTML parser
+        select = LexborHTMLParser(page_html).css_first(selector)
+        if not select:
+            return None
+        options = [option.text(strip=True) for option in select.css("option")]
+    return [option for option in options if option not in [placeholder, ""]]
+
+
 # --- Core Logic ---
 def get_states(session: requests.Session) -> list[str]:
     """Fetches the list of states from the initial page load."""
     logger.info("Fetching State List...")
     try:
+        throttle()
         response = session.get(BASE_URL, timeout=20)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
-        state_select = soup.find("select", {"id": "ddlStateList"})
-        if not state_select:
+        states = parse_dropdown(
+            response.text, STATE_SELECT_RE, "select#ddlStateList", "Select State"
+        )
+        if states is None:
             logger.error("Could not find State dropdown (ddlStateList).")
             return []
 
-        states = [
-            option.get_text(strip=True)
-            for option in state_select.find_all("option")
-            if option.get_text(strip=True) not in ["Select State", ""]
-        ]
-
         logger.info(f"Found {len(states)} states.")
         return states
 
@@ -147,20 +221,14 @@ def get_cities(session: requests.Session, state: str) -> list[str]:
         "PageNo": "0",
     }
     try:
+        throttle()
         response = session.post(BASE_URL, data=payload, timeout=20)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        city_select = soup.find("select", {"id": "ddlCityList"})
-        if not city_select:
-            return []
-
-        cities = [
-            option.get_text(strip=True)
-            for option in city_select.find_all("option")
-            if option.get_text(strip=True) not in ["Select City", ""]
-        ]
-        return cities
+        cities = parse_dropdown(
+            response.text, CITY_SELECT_RE, "select#ddlCityList", "Select City"
+        )
+        return cities or []
 
     except (
         requests.RequestException,
@@ -173,14 +241,47 @@ def get_cities(session: requests.Session, state: str) -> list[str]:
         return []
 
 
-def process_city(session: requests.Session, state: str, city: str) -> list[dict]:
+def fetch_page(
+    session: requests.Session, city: str, page_num: int
+) -> list[dict] | None:
+    """Fetches one results page of the city searched last on the session.
+    Returns None if the page could not be fetched."""
+    try:
+        logger.info(f"    Fetching {city} Page {page_num}...")
+
+        # IMPORTANT: We use GET here as per the JS logic.
+        # The session cookies maintain the State/City context from the previous POST.
+        page_url = f"{BASE_URL}?PageNumber={page_num}"
+        throttle()
+        page_resp = session.get(page_url, timeout=20)
+        page_resp.raise_for_status()
+
+        page_tree = LexborHTMLParser(page_resp.content)
+        return parse_hospital_table(page_tree)
+
+    except (
+        requests.RequestException,
+        ValueError,
+        KeyError,
+        json.JSONDecodeError,
+        TypeError,
+    ) as e:
+        logger.error(f"    Failed to fetch Page {page_num} for {city}: {e}")
+        return None
+
+
+def process_city(
+    session: requests.Session, state: str, city: str
+) -> tuple[list[dict], bool]:
     """
     Handles the entire flow for a city:
     1. Search (POST) -> Get Page 0
     2. Check 'EndPoint' for total count
     3. Loop (GET) -> Get Page 1 to N
+    Returns the hospitals found and whether every page was fetched.
     """
     city_data = []
+    complete = True
 
     # --- Step 1: Initial POST Search (Page 0) ---
     payload = {
@@ -200,22 +301,25 @@ def process_city(session: requests.Session, state: str, city: str) -> list[dict]
 
     try:
         # Request Page 0
+        throttle()
         response = session.post(BASE_URL, data=payload, timeout=20)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
+        tree = LexborHTMLParser(response.content)
 
         # Parse Page 0 Data
-        page0_data = parse_hospital_table(soup)
+        page0_data = parse_hospital_table(tree)
         city_data.extend(page0_data)
 
         # --- Step 2: Determine Pagination ---
         # Reverse engineered from: var number_of_items = ($("#EndPoint").val());
-        endpoint_input = soup.find("input", {"id": "EndPoint"})
-        total_records = int(endpoint_input.get("value", 0)) if endpoint_input else 0
+        endpoint_input = tree.css_first("input#EndPoint")
+        total_records = (
+            int(endpoint_input.attributes.get("value") or 0) if endpoint_input else 0
+        )
 
         if total_records == 0:
             logger.info(f"  No records found for {city}, {state}")
-            return []
+            return [], True
 
         # Logic: var totalpages = parseInt(totalrecords / recordsperpage);
         total_pages = math.ceil(total_records / RECORDS_PER_PAGE)
@@ -226,33 +330,23 @@ def process_city(session: requests.Session, state: str, city: str) -> list[dict]
 
         # --- Step 3: Fetch Remaining Pages (GET) ---
         # "GetDelistedHospitalList?PageNumber=" + pageindex;
-        # Since Page 0 is done, we iterate from 1 to total_pages - 1
-        for page_num in range(1, total_pages):
-            time.sleep(0.3)
-            try:
-                logger.info(f"    Fetching {city} Page {page_num}...")
-
-                # IMPORTANT: We use GET here as per the JS logic.
-                # The session cookies maintain the State/City context from the previous POST.
-                page_url = f"{BASE_URL}?PageNumber={page_num}"
-                page_resp = session.get(page_url, timeout=20)
-                page_resp.raise_for_status()
-
-                page_soup = BeautifulSoup(page_resp.text, "html.parser")
-                page_data = parse_hospital_table(page_soup)
-                city_data.extend(page_data)
-
-            except (
-                requests.RequestException,
-                ValueError,
-                KeyError,
-                json.JSONDecodeError,
-                TypeError,
-            ) as e:
-                logger.error(f"    Failed to fetch Page {page_num} for {city}: {e}")
-            time.sleep(0.5)  # Small delay between page requests
-
-        return city_data
+        # Since Page 0 is done, we fetch 1 to total_pages - 1. The GETs only
+        # read the context set by the POST, so they run together on the session
+        if total_pages > 1:
+            with ThreadPoolExecutor(max_workers=PAGE_WORKERS) as pool:
+                pages = pool.map(
+                    fetch_page,
+                    repeat(session),
+                    repeat(city),
+                    range(1, total_pages),
+                )
+                for page_data in pages:
+                    if page_data is None:
+                        complete = False
+                    else:
+                        city_data.extend(page_data)
+
+        return city_data, complete
 
     except (
         requests.RequestException,
@@ -262,7 +356,36 @@ def process_city(session: requests.Session, state: str, city: str) -> list[dict]
         TypeError,
     ) as e:
         logger.error(f"Critical error processing {city}, {state}: {e}")
-        return []
+        return [], False
+
+
+def load_partial(partial_file: Path) -> dict[tuple[str, str], list[dict]]:
+    """Reads the cities saved by an interrupted run, keyed by (state, city)."""
+    done = {}
+    if not partial_file.exists():
+        return done
+    # A run that stopped long ago would mix old listings into today's output
+    age = time.time() - partial_file.stat().st_mtime
+    if age > PARTIAL_MAX_AGE:
+        logger.warning(
+            f"Discarding {partial_file.name}, last written {age / 3600:.0f} hours ago"
+        )
+        partial_file.unlink()
+        return done
+    with open(partial_file, "rb") as f:
+        for line in f:
+            try:
+                entry = orjson.loads(line)
+                done[(entry["state"], entry["city"])] = entry["hospitals"]
+            except (ValueError, KeyError, TypeError):
+                # The line being written when the run stopped
+                continue
+    return done
+
+
+def scrape_city(state: str, city: str) -> tuple[list[dict], bool]:
+    """Processes one city on the session of the calling worker thread."""
+    return process_city(get_worker_session(), state, city)
 
 
 def main():
@@ -275,7 +398,7 @@ def main():
         logger.error("No states found. Exiting.")
         return
 
-    all_data = []
+    jobs = []
 
     # Iterate over all States
     for i, state in enumerate(states):
@@ -288,15 +411,40 @@ def main():
             continue
 
         logger.info(f"  Found {len(cities)} cities in {state}")
+        jobs.extend((state, city) for city in cities)
+    session.close()
+
+    # Cities fetched by an interrupted run are not searched again, and a
+    # city listed twice is only searched once
+    partial_file = OUTPUT_FILENAME.with_name(OUTPUT_FILENAME.name + ".partial.jsonl")
+    city_results = load_partial(partial_file)
+    if city_results:
+        logger.info(f"Resuming, {len(city_results)} cities already fetched")
+    pending = [job for job in dict.fromkeys(jobs) if job not in city_results]
+
+    # Process Cities (Search + Pagination), the network round trips overlap
+    # across workers and map keeps the state/city order of the output
+    with (
+        ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool,
+        open(partial_file, "ab") as partial,
+    ):
+        results = pool.map(
+            scrape_city,
+            [state for state, _ in pending],
+            [city for _, city in pending],
+        )
+        for (state, city), (hospitals, complete) in zip(pending, results):
+            city_results[(state, city)] = hospitals
+            # A city with failed pages is searched again on the next run
+            if complete:
+                entry = {"state": state, "city": city, "hospitals": hospitals}
+                partial.write(orjson.dumps(entry) + b"\n")
+    for worker_session in worker_sessions:
+        worker_session.close()
 
-        for city in cities:
-            # Process City (Search + Pagination + Save)
-            hospitals = process_city(session, state, city)
-            if hospitals:
-                all_data.extend(hospitals)
-
-            # Small delay between cities
-            time.sleep(0.5)
+    all_data = []
+    for job in jobs:
+        all_data.extend(city_results[job])
 
     # Finally Save Results
     if all_data:
@@ -304,6 +452,7 @@ def main():
             logger.info(f"Saving {len(all_data)} total records to {OUTPUT_FILENAME}")
             with open(OUTPUT_FILENAME, "w", encoding="utf-8") as f:
                 json.dump(all_data, f, indent=4, ensure_ascii=False)
+            partial_file.unlink(missing_ok=True)
             logger.info("Done.")
         except (
             requests.RequestException,
@@ -314,6 +463,7 @@ def main():
         ) as e:
             logger.error(f"Error saving file: {e}")
     else:
+        partial_file.unlink(missing_ok=True)
         logger.warning("No data extracted.")
 
 
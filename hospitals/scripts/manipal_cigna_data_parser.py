@@ -8,7 +8,7 @@ from urllib.parse import urljoin
 
 import pdfplumber
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
@@ -36,6 +36,8 @@ OUTPUT_FILENAME = DATA_DIR / (COMPANY + " Excluded_Hospitals_List.json")
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 # --- Constants ---
+# Only the links of the landing page are searched
+LANDING_STRAINER = SoupStrainer("a")
 # Primary landing page to search for the link
 LANDING_URL = "https://www.manipalcigna.com/locate-us"
 
@@ -44,6 +46,27 @@ HEADERS = {
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
 }
 
+# Settings for ManipalCigna's Grid
+# They usually have solid lines. We use 'lines' strategy.
+TABLE_SETTINGS = {
+    "vertical_strategy": "lines",
+    "horizontal_strategy": "lines",
+    "snap_tolerance": 4,
+    "intersection_tolerance": 5,
+}
+# Fallback to 'text' strategy if 'lines' fails
+TEXT_TABLE_SETTINGS = {
+    "vertical_strategy": "text",
+    "horizontal_strategy": "text",
+    "snap_tolerance": 5,
+}
+
+# --- Precompiled Patterns ---
+WS_RE = re.compile(r"\s+")
+PIN_EXACT_RE = re.compile(r"^\d{6}$")
+PIN_RE = re.compile(r"\d{6}")
+SERIAL_PREFIX_RE = re.compile(r"^\d+\s+")
+
 
 def get_source_url(company_name: str, url_key: str) -> str:
     url = ""
@@ -88,7 +111,7 @@ def clean_text(text: Any) -> str:
     """Standardizes text: removes newlines, trims whitespace."""
     if not text:
         return ""
-    return re.sub(r"\s+", " ", str(text)).strip()
+    return WS_RE.sub(" ", str(text)).strip()
 
 
 def fetch_pdf_url(session: requests.Session, url: str) -> str | None:
@@ -99,7 +122,7 @@ def fetch_pdf_url(session: requests.Session, url: str) -> str | None:
     try:
         response = session.get(url, timeout=30)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = BeautifulSoup(response.text, "lxml", parse_only=LANDING_STRAINER)
 
         # Strategy 1: Look for link text containing specific keywords
         # Manipal usually uses "Exception List" or "Excluded"
@@ -176,32 +199,21 @@ def parse_pdf_content(pdf_bytes: bytes) -> list[dict]:
     """
     data_list = []
 
-    # Settings for ManipalCigna's Grid
-    # They usually have solid lines. We use 'lines' strategy.
-    table_settings = {
-        "vertical_strategy": "lines",
-        "horizontal_strategy": "lines",
-        "snap_tolerance": 4,
-        "intersection_tolerance": 5,
-    }
-
     try:
         with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
             logger.info(f"Parsing {len(pdf.pages)} pages...")
 
             for i, page in enumerate(pdf.pages):
                 # Landscape PDF: pdfplumber handles orientation automatically usually.
-                tables = page.extract_tables(table_settings)
+                tables = page.extract_tables(TABLE_SETTINGS)
 
                 # Fallback to 'text' strategy if 'lines' fails
                 if not tables:
-                    tables = page.extract_tables(
-                        {
-                            "vertical_strategy": "text",
-                            "horizontal_strategy": "text",
-                            "snap_tolerance": 5,
-                        }
-                    )
+                    tables = page.extract_tables(TEXT_TABLE_SETTINGS)
+
+                # The rows are plain lists, drop the parsed page objects so
+                # memory stays bounded to one page on long PDFs
+                page.close()
 
                 for table in tables:
                     for row in table:
@@ -221,14 +233,14 @@ def parse_pdf_content(pdf_bytes: bytes) -> list[dict]:
                         pin_idx = -1
                         for idx, cell in enumerate(clean_row):
                             # Strict 6 digit check
-                            if re.match(r"^\d{6}$", cell):
+                            if PIN_EXACT_RE.match(cell):
                                 pin_idx = idx
                                 break
 
                         if pin_idx == -1:
                             # Loose check (contains 6 digits)
                             for idx, cell in enumerate(clean_row):
-                                if re.search(r"\d{6}", cell):
+                                if PIN_RE.search(cell):
                                     pin_idx = idx
                                     break
 
@@ -260,7 +272,7 @@ def parse_pdf_content(pdf_bytes: bytes) -> list[dict]:
                         # Validation
                         if name and (pincode.isdigit() or len(pincode) >= 4):
                             # Cleanup Name (remove leading numbers if Sr No merged)
-                            name = re.sub(r"^\d+\s+", "", name)
+                            name = SERIAL_PREFIX_RE.sub("", name)
 
                             data_list.append(
                                 {
@@ -7,6 +7,7 @@ import time
 from pathlib import Path
 from typing import Any
 
+import orjson
 import pandas as pd
 from playwright.sync_api import sync_playwright
 
@@ -31,6 +32,12 @@ DATA_DIR.mkdir(parents=True, exist_ok=True)
 # --- Constants ---
 TARGET_URL = "https://orientalinsurance.org.in/network-hospitals"
 
+# --- Precompiled Patterns ---
+WS_RE = re.compile(r"\s+")
+PIN_RE = re.compile(r"\b\d{6}\b")
+TRAILING_JUNK_RE = re.compile(r"[,\s-]+$")
+EDGE_JUNK_RE = re.compile(r"^[,\s-]+|[,\s-]+$")
+
 # List of Correct State Names (Source of Truth)
 INDIAN_STATES = [
     "Andhra Pradesh",
@@ -71,6 +78,9 @@ INDIAN_STATES = [
     "Ladakh",
 ]
 
+# Lower-cased once for the case-insensitive lookups, in list order
+STATES_BY_LOWER = {state.lower(): state for state in INDIAN_STATES}
+
 # Mapping Major Cities to States (Inference Fallback)
 CITY_STATE_MAP = {
     "mumbai": "Maharashtra",
@@ -171,10 +181,9 @@ class ReferenceDataManager:
                 continue
 
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self._process_file_data(data)
-                    count += 1
+                data = orjson.loads(file_path.read_bytes())
+                self._process_file_data(data)
+                count += 1
             except (
                 OSError,
                 ValueError,
@@ -232,14 +241,21 @@ class DataCleaner:
         """Standardizes text: removes newlines, trims whitespace."""
         if pd.isna(text) or text == "" or str(text).lower() == "nan":
             return ""
-        return re.sub(r"\s+", " ", str(text)).strip()
+        return WS_RE.sub(" ", str(text)).strip()
+
+    @staticmethod
+    def clean_column(col: pd.Series) -> pd.Series:
+        """Column-wide clean_text: collapses whitespace, blanks NaN and 'nan'."""
+        text = col.astype(str)
+        blank = col.isna() | (text.str.lower() == "nan")
+        return text.str.split().str.join(" ").mask(blank, "")
 
     @staticmethod
     def extract_pincode(text: str) -> str:
         """Finds a 6-digit number in the text string."""
         if not text:
             return ""
-        match = re.search(r"\b\d{6}\b", text)
+        match = PIN_RE.search(text)
         return match.group(0) if match else ""
 
     @staticmethod
@@ -260,35 +276,22 @@ class DataCleaner:
             if pincode:
                 cleaned = cleaned.replace(pincode, "")
 
-            # Helper to strip a specific word from the END of the string
-            def strip_suffix(text, suffix):
-                if not suffix:
-                    return text
-                # Regex: comma(opt) + space(opt) + suffix + space(opt) + end_of_string
-                # (?i) = case insensitive match
-                pattern = r"(?i)(,\s*)?\b" + re.escape(suffix) + r"\s*$"
-                return re.sub(pattern, "", text)
-
-            # 2. Iteratively clean trailing junk and City/State
-            # We loop because removing "State" might expose "City" at the end.
-            # e.g. "Address, City, State" -> removes State -> "Address, City" -> removes City
-            for _ in range(3):
-                # First, clean trailing commas, dashes, or spaces left behind by previous steps
-                cleaned = re.sub(r"[,\s-]+$", "", cleaned)
-
-                original_len = len(cleaned)
-
-                # Try removing State from the end
-                if state:
-                    cleaned = strip_suffix(cleaned, state)
-
-                # Try removing City from the end
-                if city:
-                    cleaned = strip_suffix(cleaned, city)
-
-                # If nothing changed in this pass, we are done
-                if len(cleaned) == original_len:
-                    break
+            # 2. Strip trailing junk and City/State in one anchored pass
+            # The repeat peels "Address, City, State" down to "Address", since
+            # removing "State" exposes "City" at the end.
+            names = "|".join(re.escape(name) for name in (state, city) if name)
+            if names:
+                # Regex: (separators(opt) + word boundary + city or state) repeated
+                # + separators(opt) + end_of_string, case insensitive
+                cleaned = re.sub(
+                    r"(?i)(?:[,\s-]*\b(?:" + names + r"))*[,\s-]*$", "", cleaned
+                )
+                # Separators are trimmed at both ends. An address made only of
+                # city/state names ends up blank, so the caller falls back
+                # to the raw address
+                cleaned = EDGE_JUNK_RE.sub("", cleaned)
+            else:
+                cleaned = TRAILING_JUNK_RE.sub("", cleaned)
 
             return cleaned.strip()
 
@@ -310,9 +313,9 @@ class DataCleaner:
             return ""
 
         # 1. Exact match check (case-insensitive)
-        for valid_state in INDIAN_STATES:
-            if valid_state.lower() == state_name.lower():
-                return valid_state
+        valid_state = STATES_BY_LOWER.get(state_name.lower())
+        if valid_state:
+            return valid_state
 
         # 2. Fuzzy Match using built-in difflib
         # cutoff=0.8 means 80% similarity required
@@ -334,8 +337,8 @@ class DataCleaner:
     def detect_state_in_text(text: str) -> str:
         """Searches address string for a known State name."""
         search_text = text.lower()
-        for state in INDIAN_STATES:
-            if state.lower() in search_text:
+        for state_lower, state in STATES_BY_LOWER.items():
+            if state_lower in search_text:
                 return state
         return ""
 
@@ -456,15 +459,19 @@ def parse_excel_to_json():
 
         data_list = []
 
-        for _, row in df.iterrows():
+        # Clean the used columns once, a missing column reads as blanks
+        def clean_col(col):
+            if col is None:
+                return [""] * len(df)
+            return DataCleaner.clean_column(df[col])
+
+        for name, raw_address, city in zip(
+            clean_col(col_name), clean_col(col_addr), clean_col(col_city)
+        ):
             # Extract Name
-            name = DataCleaner.clean_text(row.get(col_name))
             if not name or col_name in name.lower():
                 continue
 
-            raw_address = DataCleaner.clean_text(row.get(col_addr))
-            city = DataCleaner.clean_text(row.get(col_city))
-
             # --- 1. PINCODE EXTRACTION ---
             pincode = DataCleaner.extract_pincode(raw_address)
             # Try lookup from other JSONs (if same hospital name exists)
@@ -8,7 +8,7 @@ from typing import Any
 
 import pdfplumber
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
@@ -36,11 +36,37 @@ OUTPUT_FILENAME = DATA_DIR / (COMPANY + " Excluded_Hospitals_List.json")
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 # --- Constants ---
+# Only the __NEXT_DATA__ script and the links of the landing page are searched
+LANDING_STRAINER = SoupStrainer(["script", "a"])
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36",
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
 }
 
+# SETTING 1: Strict Grid Extraction
+# We use "lines" because your PDF image shows clear black borders.
+# This prevents 'Vedanayagam Hospi' from splitting into two columns.
+TABLE_SETTINGS = {
+    "vertical_strategy": "lines",
+    "horizontal_strategy": "lines",
+    "snap_tolerance": 4,  # Snaps lines that almost touch
+    "join_tolerance": 4,  # Joins broken lines
+    "intersection_tolerance": 4,
+}
+# FALLBACK: If "lines" fails (e.g., invisible borders), try "text" with loose tolerance
+TEXT_TABLE_SETTINGS = {
+    "vertical_strategy": "text",
+    "horizontal_strategy": "text",
+    "snap_tolerance": 3,
+    "x_tolerance": 20,  # Higher tolerance to ignore spaces inside names
+}
+
+# --- Precompiled Patterns ---
+WS_RE = re.compile(r"\s+")
+DIGITS_RE = re.compile(r"^\d+$")
+NON_DIGIT_RE = re.compile(r"\D")
+SERIAL_PREFIX_RE = re.compile(r"^\d+\s+")
+
 
 def get_source_url(company_name: str, url_key: str) -> str:
     url = ""
@@ -78,7 +104,7 @@ def get_session() -> requests.Session:
 def clean_text(text: Any) -> str:
     if not text:
         return ""
-    return re.sub(r"\s+", " ", str(text)).strip()
+    return WS_RE.sub(" ", str(text)).strip()
 
 
 def fetch_pdf_url(session: requests.Session, url: str) -> str | None:
@@ -89,7 +115,7 @@ def fetch_pdf_url(session: requests.Session, url: str) -> str | None:
     try:
         response = session.get(url, timeout=30)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = BeautifulSoup(response.text, "html.parser", parse_only=LANDING_STRAINER)
         # find script with id="__NEXT_DATA__"
         json_data = soup.find("script", id="__NEXT_DATA__")
         if json_data:
@@ -190,38 +216,24 @@ def parse_pdf_content(pdf_bytes: bytes) -> list[dict]:
     """
     data_list = []
 
-    # SETTING 1: Strict Grid Extraction
-    # We use "lines" because your PDF image shows clear black borders.
-    # This prevents 'Vedanayagam Hospi' from splitting into two columns.
-    table_settings = {
-        "vertical_strategy": "lines",
-        "horizontal_strategy": "lines",
-        "snap_tolerance": 4,  # Snaps lines that almost touch
-        "join_tolerance": 4,  # Joins broken lines
-        "intersection_tolerance": 4,
-    }
-
     try:
         with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
             logger.info(f"Parsing {len(pdf.pages)} pages...")
 
             for i, page in enumerate(pdf.pages):
                 # Extract tables using the grid
-                tables = page.extract_tables(table_settings)
+                tables = page.extract_tables(TABLE_SETTINGS)
 
                 # FALLBACK: If "lines" fails (e.g., invisible borders), try "text" with loose tolerance
                 if not tables:
                     logger.info(
                         f"Page {i+1}: No grid lines found, switching to text analysis."
                     )
-                    tables = page.extract_tables(
-                        {
-                            "vertical_strategy": "text",
-                            "horizontal_strategy": "text",
-                            "snap_tolerance": 3,
-                            "x_tolerance": 20,  # Higher tolerance to ignore spaces inside names
-                        }
-                    )
+                    tables = page.extract_tables(TEXT_TABLE_SETTINGS)
+
+                # The rows are plain lists, drop the parsed page objects so
+                # memory stays bounded to one page on long PDFs
+                page.close()
 
                 for table in tables:
                     for i, row in enumerate(table):
@@ -264,7 +276,7 @@ def parse_pdf_content(pdf_bytes: bytes) -> list[dict]:
                         elif len(clean_row) == 5:
                             # Case: Sr.No might be merged into Name
                             # Check if first col starts with number
-                            if re.match(r"^\d+$", clean_row[0]):
+                            if DIGITS_RE.match(clean_row[0]):
                                 # 0:Sr, 1:Name, 2:Addr, 3:City+Pin?? -> Likely malformed
                                 # Let's trust the end of the list
                                 state = clean_row[-1]
@@ -283,7 +295,7 @@ def parse_pdf_content(pdf_bytes: bytes) -> list[dict]:
                         # 5. Fix "Column Shift" (Pincode validation)
                         if i == 1:
                             # sometimes PIN in first row has strings to be removed and get only digits
-                            pincode = re.sub(r"\D", "", pincode)
+                            pincode = NON_DIGIT_RE.sub("", pincode)
                         # Sometimes City/State get mixed. Pincode is the anchor.
                         # If Pincode column is not digit, maybe it shifted to 'State' column?
                         if not (pincode.isdigit() and len(pincode) == 6):
@@ -303,7 +315,7 @@ def parse_pdf_content(pdf_bytes: bytes) -> list[dict]:
                         # 6. Final Clean & Save
                         if name and pincode.isdigit() and len(pincode) == 6:
                             # Remove Sr No if it stuck to the name (e.g. "40 Sp Medical")
-                            name = re.sub(r"^\d+\s+", "", name)
+                            name = SERIAL_PREFIX_RE.sub("", name)
 
                             data_list.append(
                                 {
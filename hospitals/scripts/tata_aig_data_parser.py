@@ -8,7 +8,7 @@ from urllib.parse import urljoin
 
 import pdfplumber
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
@@ -36,11 +36,29 @@ OUTPUT_FILENAME = DATA_DIR / (COMPANY + " Excluded_Hospitals_List.json")
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 # --- Constants ---
+# Only the links of the landing page are searched
+LANDING_STRAINER = SoupStrainer("a")
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36",
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
 }
 
+# IMPROVED SETTINGS:
+# Increased tolerances allow detection of lines that are slightly broken or misaligned.
+TABLE_SETTINGS = {
+    "vertical_strategy": "lines",
+    "horizontal_strategy": "lines",
+    "snap_tolerance": 5,  # Higher tolerance for snapping lines
+    "join_tolerance": 5,  # Joins dashed/broken lines
+    "intersection_tolerance": 10,  # For corners that don't touch perfectly
+}
+
+# --- Precompiled Patterns ---
+WS_RE = re.compile(r"\s+")
+PIN_EXACT_RE = re.compile(r"^\d{6}$")
+PIN_RE = re.compile(r"\d{6}")
+SERIAL_PREFIX_RE = re.compile(r"^\d+\s+")
+
 
 def get_source_url(company_name: str, url_key: str) -> str:
     url = ""
@@ -84,7 +102,7 @@ def clean_text(text: Any) -> str:
     """Standardizes text: removes newlines, trims whitespace."""
     if not text:
         return ""
-    return re.sub(r"\s+", " ", str(text)).strip()
+    return WS_RE.sub(" ", str(text)).strip()
 
 
 def fetch_pdf_url(session: requests.Session, url: str) -> str | None:
@@ -95,7 +113,7 @@ def fetch_pdf_url(session: requests.Session, url: str) -> str | None:
     try:
         response = session.get(url, timeout=30)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = BeautifulSoup(response.text, "html.parser", parse_only=LANDING_STRAINER)
 
         # Strategy 1: Look for link text containing specific keywords
         # The site usually says "Click here to know the list Of Excluded Provider"
@@ -154,16 +172,6 @@ def parse_pdf_content(pdf_bytes: bytes) -> list[dict]:
     """
     data_list = []
 
-    # IMPROVED SETTINGS:
-    # Increased tolerances allow detection of lines that are slightly broken or misaligned.
-    table_settings = {
-        "vertical_strategy": "lines",
-        "horizontal_strategy": "lines",
-        "snap_tolerance": 5,  # Higher tolerance for snapping lines
-        "join_tolerance": 5,  # Joins dashed/broken lines
-        "intersection_tolerance": 10,  # For corners that don't touch perfectly
-    }
-
     try:
         with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
             logger.info(f"Parsing {len(pdf.pages)} pages...")
@@ -176,7 +184,11 @@ def parse_pdf_content(pdf_bytes: bytes) -> list[dict]:
                     height = page.height
                     target_page = page.crop((0, height * 0.01, width, height))
 
-                tables = target_page.extract_tables(table_settings)
+                tables = target_page.extract_tables(TABLE_SETTINGS)
+
+                # The rows are plain lists, drop the parsed page objects so
+                # memory stays bounded to one page on long PDFs
+                page.close()
 
                 for table in tables:
                     for row in table:
@@ -195,14 +207,14 @@ def parse_pdf_content(pdf_bytes: bytes) -> list[dict]:
                         pin_idx = -1
                         for idx, cell in enumerate(clean_row):
                             # Check if cell is exactly 6 digits
-                            if re.match(r"^\d{6}$", cell):
+                            if PIN_EXACT_RE.match(cell):
                                 pin_idx = idx
                                 break
 
                         # If no strict 6-digit match, look for something that contains 6 digits
                         if pin_idx == -1:
                             for idx, cell in enumerate(clean_row):
-                                if re.search(r"\d{6}", cell):
+                                if PIN_RE.search(cell):
                                     pin_idx = idx
                                     break
 
@@ -257,9 +269,9 @@ def parse_pdf_content(pdf_bytes: bytes) -> list[dict]:
 
                         # Final Cleanup
                         # Sometimes Sl No merges into Name ("45 Dr. Savla")
-                        if name and re.match(r"^\d+\s", name):
+                        if name and SERIAL_PREFIX_RE.match(name):
                             # Only split if it looks like a serial number (1-4 digits)
-                            split_name = re.split(r"^\d+\s+", name, maxsplit=1)
+                            split_name = SERIAL_PREFIX_RE.split(name, maxsplit=1)
                             if len(split_name) > 1:
                                 name = split_name[1]
 
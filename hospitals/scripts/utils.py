@@ -0,0 +1,99 @@
+import hashlib
+import logging
+import multiprocessing
+from pathlib import Path
+from typing import Any
+
+import orjson
+import pymupdf
+
+logger = logging.getLogger(__name__)
+
+# Words are bucketed into square tiles of this size (in points) for cell lookups
+GRID_SIZE = 50
+
+# Forked workers share the PDF bytes without pickling them, where fork exists
+MP_CONTEXT = multiprocessing.get_context(
+    "fork" if "fork" in multiprocessing.get_all_start_methods() else None
+)
+
+# PDF opened once in each worker process by init_pdf_worker
+worker_pdf = None
+
+
+# --- PDF Table Cells ---
+def bucket_words(words: list[tuple]) -> dict[tuple[int, int], list[tuple]]:
+    """Buckets page words by the grid tile that holds their centre point."""
+    grid = {}
+    for w in words:
+        x_mid = (w[0] + w[2]) / 2
+        y_mid = (w[1] + w[3]) / 2
+        key = (int(y_mid // GRID_SIZE), int(x_mid // GRID_SIZE))
+        grid.setdefault(key, []).append(w)
+    return grid
+
+
+def get_cell_text(grid: dict[tuple[int, int], list[tuple]], cell: tuple) -> str:
+    """Joins the words centred in a cell, only scanning the tiles it overlaps."""
+    x0, top, x1, bottom = cell
+    found = []
+    for gy in range(int(top // GRID_SIZE), int(bottom // GRID_SIZE) + 1):
+        for gx in range(int(x0 // GRID_SIZE), int(x1 // GRID_SIZE) + 1):
+            for w in grid.get((gy, gx), ()):
+                x_mid = (w[0] + w[2]) / 2
+                y_mid = (w[1] + w[3]) / 2
+                if x0 <= x_mid < x1 and top <= y_mid < bottom:
+                    found.append(w)
+
+    # Words keep reading order by (block, line, word) numbers
+    found.sort(key=lambda w: (w[5], w[6], w[7]))
+    lines = {}
+    for w in found:
+        lines.setdefault((w[5], w[6]), []).append(w[4])
+    return "\n".join(" ".join(line) for line in lines.values())
+
+
+def extract_rows(table: Any, grid: dict[tuple[int, int], list[tuple]]) -> list:
+    """Returns the cell text of every row in a table, None for merged cells."""
+    return [
+        [get_cell_text(grid, cell) if cell is not None else None for cell in row.cells]
+        for row in table.rows
+    ]
+
+
+# --- PDF Worker Processes ---
+def init_pdf_worker(pdf_bytes: bytes) -> None:
+    """Opens the PDF once per worker process."""
+    global worker_pdf
+    worker_pdf = pymupdf.open(stream=pdf_bytes, filetype="pdf")
+
+
+# --- Parse Cache ---
+def get_cache_path(
+    cache_dir: Path, company: str, pdf_bytes: bytes, parser_version: int
+) -> Path:
+    """Cache file for the rows this parser version got from this exact PDF."""
+    digest = hashlib.sha256(pdf_bytes).hexdigest()
+    return cache_dir / f"{company}_v{parser_version}_{digest}.json"
+
+
+def load_parse_cache(cache_path: Path) -> list | None:
+    """Returns the rows parsed earlier from the same PDF, if any."""
+    if not cache_path.exists():
+        return None
+    try:
+        return orjson.loads(cache_path.read_bytes())
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.warning(f"Ignoring unreadable cache {cache_path.name}: {e}")
+        return None
+
+
+def save_parse_cache(cache_path: Path, company: str, rows: list) -> None:
+    """Keeps only the parsed rows of the latest PDF for this company."""
+    try:
+        cache_path.parent.mkdir(exist_ok=True)
+        for old in cache_path.parent.glob(f"{company}_*.json"):
+            old.unlink()
+        cache_path.write_bytes(orjson.dumps(rows))
+    except OSError as e:
+        logger.warning(f"Could not write cache {cache_path.name}: {e}")